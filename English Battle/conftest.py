@@ -0,0 +1,5 @@
+"""Pytest setup: run pygame headless so the game modules can be imported."""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -3,6 +3,9 @@ font resources for the game.
 """
 import os
 
+import pygame
+from pygame.font import Font
+
 FONTS_DIR = os.path.dirname(__file__)
 
 FONTS: dict[str, str] = {
@@ -10,3 +13,19 @@ FONTS: dict[str, str] = {
   "retro-british": os.path.join(FONTS_DIR, "RetroBritish.otf"),
   "roboto": os.path.join(FONTS_DIR, "Roboto.ttf")
 }
+
+_loaded_fonts: dict[tuple[str | None, int], Font] = {}
+
+
+def load_font(path: str | None, size: int) -> Font:
+  """
+  Returns the font for the given file and size, opening the file only once.
+  :param path: Path to the font file, or None for the default font.
+  :param size: Font size in points.
+  :return: The loaded font.
+  """
+  font = _loaded_fonts.get((path, size))
+  if font is None:
+    font = pygame.font.Font(path, size)
+    _loaded_fonts[(path, size)] = font
+  return font
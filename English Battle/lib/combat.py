@@ -2,16 +2,24 @@
 Module to manage combat encounters with grammar questions in a Pygame application.
 """
 import random
+import string
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Any
 
 import pygame
 from pygame import Rect, Surface, MOUSEBUTTONDOWN, MOUSEBUTTONUP
 from pygame.event import EventType
 from pygame.font import FontType, Font
 
+from font import load_font
 from lib.color import Color
 
+_fit_layouts: dict[tuple[str | None, int, int, int], tuple[Font, int, int]] = {}
+_ANSWER_CHARS: frozenset[str] = frozenset(
+  string.ascii_letters + string.digits + " ,.;:'\"-?!¡¿áéíóúüñÁÉÍÓÚÜÑ")
+_ANSWER_MAX_LENGTH: int = 40
+_CURSOR_BLINK_MS: int = 500
+
 
 class ScoreSystem:
   """
@@ -51,7 +59,10 @@ class Combat:
     self.__active: bool = True
     self.__current_question: str | tuple[str, list[str], str] | None = None
     self.__current_answer: str | None = None
-    self.__last_question: str | None = None
+    self.__current_answer_norm: str = ""
+    self.__shuffled_words: list[str] = []
+    self.__last_index: int | None = None
+    self.__question_queue: list[int] = []
     self.__questions_set = questions_set if questions_set is not None else []
     self.__score_system = score_system if score_system else Var.score_system
 
@@ -64,6 +75,7 @@ class Combat:
     if not self.__questions_set:
       self.__current_question = None
       self.__current_answer = None
+      self.__current_answer_norm = ""
     if self.__combat_type == "word_ordering":
       response = self.__generate_word_order_question(self.__questions_set)
     elif self.__combat_type == "multiple_choice":
@@ -74,6 +86,21 @@ class Combat:
       response = ""
     return response
 
+  def __next_question_index(self, count: int) -> int:
+    """
+    Picks the next question from a shuffled queue of indices, so every question
+    is asked once before any is repeated and none is asked twice in a row.
+    :param count: Number of questions available.
+    :return: Index of the question to ask.
+    """
+    if not self.__question_queue:
+      queue = random.sample(range(count), count)
+      if count > 1 and queue[-1] == self.__last_index:
+        queue[0], queue[-1] = queue[-1], queue[0]
+      self.__question_queue = queue
+    self.__last_index = self.__question_queue.pop()
+    return self.__last_index
+
   def __generate_fill_blank_question(self,
       questions: list[dict[str, list[str]]]) -> str | None:
     """
@@ -81,16 +108,10 @@ class Combat:
     :param questions: set of questions to choose from.
     :return: The generated question string.
     """
-    question: Optional[str] = None
-    answer: Optional[str] = None
-    same_question = True
-    while same_question:
-      question, answer = random.choice(questions)
-      if question != self.__last_question:
-        same_question = False
+    question, answer = questions[self.__next_question_index(len(questions))]
     self.__current_question = question
     self.__current_answer = answer
-    self.__last_question = question
+    self.__current_answer_norm = answer.strip().casefold()
     return self.__current_question
 
   def __generate_multiple_choice_question(self,
@@ -101,17 +122,11 @@ class Combat:
     :param questions:  List of questions to choose from.
     :return:  The generated question, options, and answer.
     """
-    question: Optional[str] = None
-    answer: Optional[str] = None
-    options: Optional[list[dict[str, list[str]]]] = None
-    same_question = True
-    while same_question:
-      question, options, answer = random.choice(questions)
-      if question != self.__last_question:
-        same_question = False
+    question, options, answer = questions[
+      self.__next_question_index(len(questions))]
     self.__current_question = (question, options, answer)
     self.__current_answer = answer
-    self.__last_question = question
+    self.__current_answer_norm = answer.strip().casefold()
     return self.__current_question
 
   def __generate_word_order_question(self, questions: list) -> str | None:
@@ -120,19 +135,14 @@ class Combat:
     :param questions: List of questions to choose from.
     :return:  The generated question string.
     """
-    question: Optional[str] = None
-    answer: Optional[str] = None
-    same_question = True
-    while same_question:
-      words, answer = random.choice(questions)
-      shuffled_words = list(words)
-      random.shuffle(shuffled_words)
-      question = " / ".join(shuffled_words)
-      if question != self.__last_question:
-        same_question = False
+    words, answer = questions[self.__next_question_index(len(questions))]
+    shuffled_words = list(words)
+    random.shuffle(shuffled_words)
+    question = " / ".join(shuffled_words)
+    self.__shuffled_words = shuffled_words
     self.__current_question = question
     self.__current_answer = answer
-    self.__last_question = question
+    self.__current_answer_norm = answer.strip().casefold()
     return self.__current_question
 
   def check_answer(self, player_answer: str) -> bool:
@@ -141,7 +151,7 @@ class Combat:
     :param player_answer: The answer provided by the player.
     :return: True if the answer is correct, False otherwise.
     """
-    return player_answer.strip().lower() == self.__current_answer.strip().lower()
+    return player_answer.strip().casefold() == self.__current_answer_norm
 
   def process_turn(self, player_answer: str) -> str:
     """
@@ -181,6 +191,13 @@ class Combat:
     """
     return self.__current_question
 
+  def get_shuffled_words(self) -> list[str]:
+    """
+    Returns the shuffled words of the current word ordering question.
+    :return: The shuffled words.
+    """
+    return self.__shuffled_words
+
   def get_active(self) -> bool:
     """
     Returns whether the combat is still active.
@@ -213,30 +230,68 @@ def _render_text_multiline(text: str, font_path, base_size: int,
   lines = []
   adjustment_ok = False
   while font_size >= 16 and not adjustment_ok:
-    font = pygame.font.Font(font_path, font_size)
+    font = load_font(font_path, font_size)
     lines = []
     current_line = ""
+    current_width = 0
+    line_words = 0
+    # Lines are measured with the font metrics and only rendered once they fit.
+    # Each word is measured once and line widths are summed from them. Glyph
+    # advances are rounded per string, so a sum can be a pixel off at every
+    # word joint; only lines that close to the limit are measured whole.
+    space_width = font.size(" ")[0]
     for word in words:
-      test_line = current_line + (" " if current_line else "") + word
-      test_surface = font.render(test_line, True, color)
-      if test_surface.get_width() > max_width and current_line:
-        lines.append(current_line)
-        current_line = word
+      word_width = font.size(word)[0]
+      if not current_line:
+        current_line, current_width, line_words = word, word_width, 1
+        continue
+      test_line = current_line + " " + word
+      test_width = current_width + space_width + word_width
+      slack = 2 * line_words
+      if test_width < max_width - slack:
+        fits = True
+      elif test_width > max_width + slack:
+        fits = False
+      else:
+        fits = font.size(test_line)[0] <= max_width
+      if fits:
+        current_line, current_width = test_line, test_width
+        line_words += 1
       else:
-        current_line = test_line
+        lines.append(current_line)
+        current_line, current_width, line_words = word, word_width, 1
     if current_line:
       lines.append(current_line)
-    adjustment_ok = all(
-        font.render(line, True, color).get_width() <= max_width for line in
-        lines)
+    adjustment_ok = all(font.size(line)[0] <= max_width for line in lines)
     if not adjustment_ok:
       font_size = int(font_size * 0.92)
-  font = pygame.font.Font(font_path, font_size)
-  surfaces = []
-  for line in lines:
-    surf = font.render(line, True, color)
-    surfaces.append(surf)
-  return surfaces
+  font = load_font(font_path, font_size)
+  return [font.render(line, True, color) for line in lines]
+
+
+def _compose_tile(size: tuple[int, int], bg_color: tuple[int, int, int],
+    border_color: tuple[int, int, int] | None, text: Surface,
+    text_offset: tuple[int, int]) -> tuple[Surface, tuple[int, int]]:
+  """
+  Composes a filled box, its border and its text into a single surface.
+  :param size: Size of the box.
+  :param bg_color: Fill color of the box.
+  :param border_color: Border color of the box, or None for no border.
+  :param text: Rendered text to place on the box.
+  :param text_offset: Position of the text relative to the box.
+  :return: The composed surface and its offset relative to the box. The surface
+    grows past the box when the text overflows it.
+  """
+  left, top = min(0, text_offset[0]), min(0, text_offset[1])
+  right = max(size[0], text_offset[0] + text.get_width())
+  bottom = max(size[1], text_offset[1] + text.get_height())
+  tile = Surface((right - left, bottom - top), pygame.SRCALPHA)
+  box = Rect(-left, -top, size[0], size[1])
+  pygame.draw.rect(tile, bg_color, box)
+  if border_color is not None:
+    pygame.draw.rect(tile, border_color, box, 2)
+  tile.blit(text, (text_offset[0] - left, text_offset[1] - top))
+  return tile.convert_alpha(), (left, top)
 
 
 class BaseCombatModal(ABC):
@@ -253,13 +308,16 @@ class BaseCombatModal(ABC):
     self.__rect: Rect = rect
     self.__confirmed: bool = False
     self.__result_text: str = result_text
+    self.__result_surface: Surface | None = None
     self.__confirm_btn_rect: Rect | None = None
     self.__reset_btn_rect: Rect | None = None
+    self.__confirm_btn_tile: tuple[Surface, tuple[int, int]] | None = None
+    self.__reset_btn_tile: tuple[Surface, tuple[int, int]] | None = None
     self.__init_buttons()
 
   def __init_buttons(self) -> None:
     """
-    Initializes the Confirm and Reset button rectangles.
+    Initializes the Confirm and Reset button rectangles and surfaces.
     """
     btn_w, btn_h = 100, 36
     margin = 10
@@ -268,6 +326,22 @@ class BaseCombatModal(ABC):
         self.__rect.x + self.__rect.width - btn_w - margin, y_btn, btn_w, btn_h)
     self.__reset_btn_rect = pygame.Rect(
         self.__rect.x + margin, y_btn, btn_w, btn_h)
+    self.__confirm_btn_tile = self.__compose_button("Confirmar", btn_w, btn_h)
+    self.__reset_btn_tile = self.__compose_button("Reiniciar", btn_w, btn_h)
+
+  def __compose_button(self, label: str, btn_w: int,
+      btn_h: int) -> tuple[Surface, tuple[int, int]]:
+    """
+    Composes a button with its label centered on it.
+    :param label: The button label.
+    :param btn_w: The button width.
+    :param btn_h: The button height.
+    :return: The composed button surface and its offset.
+    """
+    txt = self.__font.render(label, True, Color.TITLE_TEXT)
+    txt_rect = txt.get_rect(center=(btn_w // 2, btn_h // 2))
+    return _compose_tile((btn_w, btn_h), Color.WORD_BG, Color.WORD_BORDER, txt,
+                         txt_rect.topleft)
 
   def get_confirmed(self) -> bool:
     """
@@ -295,7 +369,20 @@ class BaseCombatModal(ABC):
     Sets the result text to display
     :param text: The result text.
     """
-    self.__result_text = text
+    if text != self.__result_text:
+      self.__result_text = text
+      self.__result_surface = None
+
+  def get_result_surface(self) -> Surface | None:
+    """
+    Returns the rendered result text, rendering it only after it changed.
+    :return: The result text surface, or None if there is no result text.
+    """
+    if self.__result_text and self.__result_surface is None:
+      result_color = Color.CORRECT_ANSWER_BG if "Correcto" in self.__result_text else Color.WRONG_ANSWER_BG
+      self.__result_surface = self.__font.render(
+          self.__result_text, True, result_color).convert_alpha()
+    return self.__result_surface
 
   def get_rect(self) -> Rect:
     """
@@ -356,47 +443,75 @@ class BaseCombatModal(ABC):
     """
     pass
 
+  def get_render_state(self) -> tuple:
+    """
+    Returns the values that decide what the modal looks like. While they stay
+    equal, drawing the modal again produces the same picture, except for the
+    input area (see get_input_state).
+    :return: Tuple of the modal's visible state.
+    """
+    return (self.__result_text,)
+
+  def get_input_state(self) -> tuple:
+    """
+    Returns the values that only change the modal's input area. When nothing
+    else changed, draw_input is enough to bring the modal up to date.
+    :return: Tuple of the input area's visible state.
+    """
+    return ()
+
+  def draw_input(self, surface: Surface) -> Rect | None:
+    """
+    Draws only the modal's input area.
+    :param surface: The surface to draw on.
+    :return: The area drawn, or None if the modal has no input area.
+    """
+    return None
+
   def _draw_buttons(self, surface: Surface) -> None:
     """
     Draws the Confirm and Reset buttons.
     :param surface: The surface to draw on.
     """
-    pygame.draw.rect(surface, Color.WORD_BG, self.__confirm_btn_rect)
-    pygame.draw.rect(surface, Color.WORD_BORDER, self.__confirm_btn_rect, 2)
-    txt2 = self.__font.render("Confirmar", True, Color.TITLE_TEXT)
-    txt2_rect = txt2.get_rect(center=self.__confirm_btn_rect.center)
-    surface.blit(txt2, txt2_rect)
-
-    pygame.draw.rect(surface, Color.WORD_BG, self.__reset_btn_rect)
-    pygame.draw.rect(surface, Color.WORD_BORDER, self.__reset_btn_rect, 2)
-    txt = self.__font.render("Reiniciar", True, Color.TITLE_TEXT)
-    txt_rect = txt.get_rect(center=self.__reset_btn_rect.center)
-    surface.blit(txt, txt_rect)
+    for rect, (tile, offset) in (
+        (self.__confirm_btn_rect, self.__confirm_btn_tile),
+        (self.__reset_btn_rect, self.__reset_btn_tile)):
+      surface.blit(tile, (rect.x + offset[0], rect.y + offset[1]))
 
 
 class WordOrderingModal(BaseCombatModal):
   """Modal for word ordering questions with drag-and-drop."""
 
-  def __init__(self, question_words: list[str], font: FontType, rect: Rect,
+  def __init__(self, shuffled_words: list[str], font: FontType, rect: Rect,
       result_text: str = "") -> None:
     """
     Initializes the word ordering modal.
-    :param question_words: List of words to order.
+    :param shuffled_words: Already shuffled list of words to order.
     :param font: The font to use for text.
     :param rect: The rectangle defining the modal area.
     :param result_text: Initial result text to display.
     """
     super().__init__(font, rect, result_text)
-    self.__original_words = list(question_words)
-    self.__shuffled_words = list(self.__original_words)
-    random.shuffle(self.__shuffled_words)
+    self.__shuffled_words = shuffled_words
     self.__answer_words = []
+    self.__answer_set: set[str] = set()
     self.__dragging = None
     self.__word_rects = {"shuffled": [], "answer": []}
+    self.__word_tiles: dict[tuple[str, str], tuple[Surface, tuple[int, int]]] = {}
+    self.__shuffled_blits: list[tuple[Surface, tuple[int, int]]] = []
+    self.__answer_blits: list[tuple[Surface, tuple[int, int]]] = []
     self.__base_font = font
     self.__font_path = font.path if hasattr(font, "path") else None
     self.__shuffled_font = font
     self.__answer_font = font
+    self.__answer_area_rect = pygame.Rect(0, 0, 0, 0)
+    self.__title_surface = font.render("Ordena las palabras:", True,
+                                       Color.TITLE_TEXT).convert_alpha()
+    self.__hint_surface = font.render("Arrastra aquí para formar la oración",
+                                      True, Color.ANSWER_AREA_BORDER
+                                      ).convert_alpha()
+    self.__hint_rect = self.__hint_surface.get_rect(
+        center=(rect.centerx, rect.y + rect.height // 2 + 16))
     self.__update_word_rects()
 
   def __get_fit_font_and_layout(self, words: list[str], area_width: int,
@@ -408,16 +523,21 @@ class WordOrderingModal(BaseCombatModal):
     :param base_font: The base font to start with.
     :return: A tuple containing the adjusted font, word width, and max words per row
     """
-    font_size = base_font.get_height()
-    margin = 10
-    word_w = 90
-    max_per_row = max(1, area_width // (word_w + margin))
-    while len(words) > max_per_row and font_size > 16:
-      font_size = int(font_size * 0.9)
-      word_w = int(word_w * 0.9)
+    # The layout only depends on how many words there are, not on which.
+    key = (self.__font_path, base_font.get_height(), area_width, len(words))
+    layout = _fit_layouts.get(key)
+    if layout is None:
+      font_size = base_font.get_height()
+      margin = 10
+      word_w = 90
       max_per_row = max(1, area_width // (word_w + margin))
-    font = pygame.font.Font(self.__font_path, font_size)
-    return font, word_w, max_per_row
+      while len(words) > max_per_row and font_size > 16:
+        font_size = int(font_size * 0.9)
+        word_w = int(word_w * 0.9)
+        max_per_row = max(1, area_width // (word_w + margin))
+      layout = (load_font(self.__font_path, font_size), word_w, max_per_row)
+      _fit_layouts[key] = layout
+    return layout
 
   def __update_word_rects(self) -> None:
     """
@@ -426,6 +546,8 @@ class WordOrderingModal(BaseCombatModal):
     margin = 10
     title_height = 35
     area_width = self.get_rect().width - 2 * margin
+    # Fonts and word sizes may change with the layout.
+    self.__word_tiles = {}
 
     font_obj, word_w, max_per_row = self.__get_fit_font_and_layout(
         self.__shuffled_words, area_width, self.__base_font)
@@ -453,56 +575,78 @@ class WordOrderingModal(BaseCombatModal):
       self.__word_rects["answer"].append(
           pygame.Rect(x, y, word_w_ans, word_h_ans))
 
-  def draw(self, surface: Surface) -> None:
-    """
-    Draws the modal with words and buttons, ajustando desbordamiento.
-    :param surface: The surface to draw on.
-    """
-    pygame.draw.rect(surface, Color.MODAL_BG, self.get_rect())
-    title = self.get_font().render("Ordena las palabras:", True,
-                                   Color.TITLE_TEXT)
-    surface.blit(title, (self.get_rect().x + 10, self.get_rect().y + 5))
-    for i, word in enumerate(self.__shuffled_words):
-      rect: Rect = self.__word_rects["shuffled"][i]
-      if word in self.__answer_words:
-        pygame.draw.rect(surface, Color.WORD_BG_DISABLED, rect)
-        pygame.draw.rect(surface, Color.WORD_BORDER, rect, 2)
-        txt = self.__shuffled_font.render(word, True, Color.WORD_TEXT_DISABLED)
-      else:
-        pygame.draw.rect(surface, Color.WORD_BG, rect)
-        pygame.draw.rect(surface, Color.WORD_BORDER, rect, 2)
-        txt = self.__shuffled_font.render(word, True, Color.TITLE_TEXT)
-      surface.blit(txt, (rect.x + 6, rect.y + 4))
-    answer_area_rect = pygame.Rect(
+    # The answer area grows one row for each full row of answer words.
+    self.__answer_area_rect = pygame.Rect(
         self.get_rect().x + 5,
         self.get_rect().y + self.get_rect().height // 2 - 8,
         self.get_rect().width - 10,
         48 + (len(self.__answer_words) // max(1, (
             self.get_rect().width // (90 + 10))) * 42)
     )
+
+    # Words only change state here, so both areas are drawn from ready-made
+    # blit sequences.
+    self.__shuffled_blits = [
+      self.__get_word_blit(
+          word, "disabled" if word in self.__answer_set else "shuffled", rect)
+      for word, rect in zip(self.__shuffled_words,
+                            self.__word_rects["shuffled"])]
+    self.__answer_blits = [
+      self.__get_word_blit(word, "answer", rect)
+      for word, rect in zip(self.__answer_words, self.__word_rects["answer"])]
+
+  def draw(self, surface: Surface) -> None:
+    """
+    Draws the modal with words and buttons, ajustando desbordamiento.
+    :param surface: The surface to draw on.
+    """
+    pygame.draw.rect(surface, Color.MODAL_BG, self.get_rect())
+    surface.blit(self.__title_surface,
+                 (self.get_rect().x + 10, self.get_rect().y + 5))
+    surface.blits(self.__shuffled_blits, doreturn=False)
+    answer_area_rect = self.__answer_area_rect
     pygame.draw.rect(surface, Color.ANSWER_AREA_BG, answer_area_rect)
     pygame.draw.rect(surface, Color.ANSWER_AREA_BORDER, answer_area_rect, 2)
     if not self.__answer_words:
-      hint_txt = self.get_font().render("Arrastra aquí para formar la oración",
-                                        True, Color.ANSWER_AREA_BORDER)
-      hint_rect = hint_txt.get_rect(
-          center=(answer_area_rect.centerx, answer_area_rect.y + 24))
-      surface.blit(hint_txt, hint_rect)
-    for i, word in enumerate(self.__answer_words):
-      rect: Rect = self.__word_rects["answer"][i]
-      pygame.draw.rect(surface, Color.ANSWER_WORD_BG, rect)
-      pygame.draw.rect(surface, Color.WORD_BORDER, rect, 2)
-      txt = self.__answer_font.render(word, True, Color.TITLE_TEXT)
-      surface.blit(txt, (rect.x + 6, rect.y + 4))
+      surface.blit(self.__hint_surface, self.__hint_rect)
+    surface.blits(self.__answer_blits, doreturn=False)
     if self.__dragging:
       word, _, _ = self.__dragging
       mx, my = pygame.mouse.get_pos()
-      drag_rect = pygame.Rect(mx - 45, my - 16, 90, 32)
-      pygame.draw.rect(surface, Color.DRAG_WORD_BG, drag_rect)
-      txt = self.get_font().render(word, True, Color.TITLE_TEXT)
-      surface.blit(txt, (drag_rect.x + 6, drag_rect.y + 4))
+      surface.blit(*self.__get_word_blit(word, "drag",
+                                         pygame.Rect(mx - 45, my - 16, 90, 32)))
     self._draw_buttons(surface)
 
+  def __get_word_blit(self, word: str, state: str,
+      rect: Rect) -> tuple[Surface, tuple[int, int]]:
+    """
+    Returns the blit arguments of a word box, composing the box the first time
+    the word shows in a state.
+    :param word: The word to draw.
+    :param state: One of "shuffled", "disabled", "answer" or "drag".
+    :param rect: The rectangle of the word box.
+    :return: The word box surface and its position.
+    """
+    key = (word, state)
+    tile = self.__word_tiles.get(key)
+    if tile is None:
+      if state == "shuffled":
+        font, bg, border, color = (self.__shuffled_font, Color.WORD_BG,
+                                   Color.WORD_BORDER, Color.TITLE_TEXT)
+      elif state == "disabled":
+        font, bg, border, color = (self.__shuffled_font, Color.WORD_BG_DISABLED,
+                                   Color.WORD_BORDER, Color.WORD_TEXT_DISABLED)
+      elif state == "answer":
+        font, bg, border, color = (self.__answer_font, Color.ANSWER_WORD_BG,
+                                   Color.WORD_BORDER, Color.TITLE_TEXT)
+      else:
+        font, bg, border, color = (self.get_font(), Color.DRAG_WORD_BG, None,
+                                   Color.TITLE_TEXT)
+      tile = _compose_tile(rect.size, bg, border,
+                           font.render(word, True, color), (6, 4))
+      self.__word_tiles[key] = tile
+    return tile[0], (rect.x + tile[1][0], rect.y + tile[1][1])
+
   def handle_combat_event(self, event: EventType) -> None:
     """
     Handles mouse events for drag-and-drop and button clicks.
@@ -523,11 +667,12 @@ class WordOrderingModal(BaseCombatModal):
       self.set_confirmed(True)
     if self.get_reset_button().collidepoint(mx, my):
       self.__answer_words = []
+      self.__answer_set.clear()
       self.set_confirmed(False)
       self.__update_word_rects()
     for i, rect in enumerate(self.__word_rects["shuffled"]):
       word = self.__shuffled_words[i]
-      if rect.collidepoint(mx, my) and word not in self.__answer_words:
+      if rect.collidepoint(mx, my) and word not in self.__answer_set:
         self.__dragging = (word, "shuffled", i)
     for i, rect in enumerate(self.__word_rects["answer"]):
       word = self.__answer_words[i]
@@ -549,14 +694,26 @@ class WordOrderingModal(BaseCombatModal):
                                 self.get_rect().width,
                                 self.get_rect().height // 2)
     if from_area == "shuffled" and answer_area.collidepoint(mx, my):
-      if word not in self.__answer_words:
+      if word not in self.__answer_set:
         self.__answer_words.append(word)
+        self.__answer_set.add(word)
     elif from_area == "answer" and shuffled_area.collidepoint(mx, my):
-      if word in self.__answer_words:
+      if word in self.__answer_set:
         self.__answer_words.remove(word)
+        self.__answer_set.discard(word)
     self.__dragging = None
     self.__update_word_rects()
 
+  def get_render_state(self) -> tuple:
+    """
+    Returns the visible state, including the pointer while dragging a word.
+    Mouse motion events are blocked, so the pointer is read from pygame.mouse.
+    :return: Tuple of the modal's visible state.
+    """
+    return super().get_render_state() + (
+      tuple(self.__answer_words), self.__dragging,
+      pygame.mouse.get_pos() if self.__dragging else None)
+
   def get_player_answer(self) -> str:
     """
     Returns the player's constructed answer as a string.
@@ -569,6 +726,7 @@ class WordOrderingModal(BaseCombatModal):
     Resets the modal to its initial state.
     """
     self.__answer_words = []
+    self.__answer_set.clear()
     self.set_confirmed(False)
     self.__update_word_rects()
 
@@ -591,13 +749,28 @@ class MultipleChoiceModal(BaseCombatModal):
     self.__options = options
     self.__selected_index = None
     self.__option_rects = []
+    self.__option_text_blits: list[list[tuple[Surface, tuple[int, int]]]] = []
+    self.__option_lists: dict[int | None, tuple[Surface, tuple[int, int]]] = {}
+    self.__option_bgs: tuple[Surface, Surface] | None = None
     self.__font_path = font.path if hasattr(font, "path") else None
     self.__base_font = font
+    # The title and question never change, so they are only rendered once.
+    self.__title_surface = font.render("Elige la respuesta correcta:", True,
+                                       Color.TITLE_TEXT).convert_alpha()
+    question_surfaces = _render_text_multiline(
+        self.__question,
+        self.__font_path,
+        self.__base_font.get_height(),
+        self.get_rect().width - 20,
+        Color.TITLE_TEXT
+    )
+    self.__question_surfaces = [surf.convert_alpha()
+                                for surf in question_surfaces]
     self.__update_option_rects()
 
   def __update_option_rects(self) -> None:
     """
-    Updates the rectangles for the options.
+    Updates the rectangles, rendered text and backgrounds for the options.
     """
     margin = 10
     option_h = 36
@@ -609,6 +782,39 @@ class MultipleChoiceModal(BaseCombatModal):
       y = start_y + i * (option_h + margin)
       self.__option_rects.append(
           pygame.Rect(self.get_rect().x + margin, y, option_w, option_h))
+    self.__option_text_blits = []
+    for option, rect in zip(self.__options, self.__option_rects):
+      text_blits = []
+      opt_y = rect.y + 6
+      for surf in _render_text_multiline(option, self.__font_path,
+                                         self.__base_font.get_height(),
+                                         option_w - 16, Color.TITLE_TEXT):
+        text_blits.append((surf.convert_alpha(), (rect.x + 8, opt_y)))
+        opt_y += surf.get_height() + 2
+      self.__option_text_blits.append(text_blits)
+    self.__option_lists = {}
+    self.__option_bgs = (
+      self.__compose_option_bg(option_w, option_h, Color.WORD_BG,
+                               Color.WORD_BORDER),
+      self.__compose_option_bg(option_w, option_h, Color.ANSWER_WORD_BG,
+                               Color.ANSWER_AREA_BORDER))
+
+  @staticmethod
+  def __compose_option_bg(option_w: int, option_h: int,
+      bg_color: tuple[int, int, int],
+      border_color: tuple[int, int, int]) -> Surface:
+    """
+    Composes the filled and bordered background of an option.
+    :param option_w: The option width.
+    :param option_h: The option height.
+    :param bg_color: The fill color.
+    :param border_color: The border color.
+    :return: The option background surface.
+    """
+    bg = Surface((option_w, option_h))
+    bg.fill(bg_color)
+    pygame.draw.rect(bg, border_color, bg.get_rect(), 2)
+    return bg.convert()
 
   def draw(self, surface: Surface) -> None:
     """
@@ -616,54 +822,50 @@ class MultipleChoiceModal(BaseCombatModal):
     :param surface: The surface to draw on.
     """
     pygame.draw.rect(surface, Color.MODAL_BG, self.get_rect())
-    title = self.get_font().render("Elige la respuesta correcta:", True,
-                                   Color.TITLE_TEXT)
-    surface.blit(title, (self.get_rect().x + 10, self.get_rect().y + 5))
+    surface.blit(self.__title_surface,
+                 (self.get_rect().x + 10, self.get_rect().y + 5))
 
-    # Pregunta con ajuste de fuente y saltos de línea
-    question_max_width = self.get_rect().width - 20
-    question_surfaces = _render_text_multiline(
-        self.__question,
-        self.__font_path,
-        self.__base_font.get_height(),
-        question_max_width,
-        Color.TITLE_TEXT
-    )
     y_offset = self.get_rect().y + 30
-    for surf in question_surfaces:
+    for surf in self.__question_surfaces:
       surface.blit(surf, (self.get_rect().x + 10, y_offset))
       y_offset += surf.get_height() + 2
 
     # Opciones con ajuste de fuente y saltos de línea
-    for i, option in enumerate(self.__options):
-      rect: Rect = self.__option_rects[i]
-      bg_color = Color.ANSWER_WORD_BG if self.__selected_index == i else Color.WORD_BG
-      border_color = Color.ANSWER_AREA_BORDER if self.__selected_index == i else Color.WORD_BORDER
-      pygame.draw.rect(surface, bg_color, rect)
-      pygame.draw.rect(surface, border_color, rect, 2)
-      option_surfaces = _render_text_multiline(
-          option,
-          self.__font_path,
-          self.__base_font.get_height(),
-          rect.width - 16,
-          Color.TITLE_TEXT
-      )
-      opt_y = rect.y + 6
-      for surf in option_surfaces:
-        surface.blit(surf, (rect.x + 8, opt_y))
-        opt_y += surf.get_height() + 2
-      if self.__selected_index == i:
-        pygame.draw.circle(surface, Color.ANSWER_AREA_BORDER,
-                           (rect.right - 18, rect.centery), 10, 0)
+    surface.blit(*self.__get_option_list())
     self._draw_buttons(surface)
-    if self.get_result_text():
-      result_color = Color.CORRECT_ANSWER_BG if "Correcto" in self.get_result_text() else Color.WRONG_ANSWER_BG
-      result_surface = self.get_font().render(self.get_result_text(), True,
-                                              result_color)
+    result_surface = self.get_result_surface()
+    if result_surface:
       result_x = self.get_rect().x + 10
       result_y = self.get_confirm_button().bottom + 10
       surface.blit(result_surface, (result_x, result_y))
 
+  def __get_option_list(self) -> tuple[Surface, tuple[int, int]]:
+    """
+    Returns the whole option list composed into one surface, composing it the
+    first time each option is selected.
+    :return: The option list surface and its position.
+    """
+    option_list = self.__option_lists.get(self.__selected_index)
+    if option_list is None:
+      blit_sequence = []
+      for i, rect in enumerate(self.__option_rects):
+        bg = self.__option_bgs[self.__selected_index == i]
+        blit_sequence.append((bg, rect.topleft))
+        blit_sequence.extend(self.__option_text_blits[i])
+      area = Rect(blit_sequence[0][1], (0, 0)).unionall(
+          [surf.get_rect(topleft=pos) for surf, pos in blit_sequence])
+      composed = Surface(area.size, pygame.SRCALPHA)
+      composed.blits([(surf, (pos[0] - area.x, pos[1] - area.y))
+                      for surf, pos in blit_sequence], doreturn=False)
+      if self.__selected_index is not None:
+        rect = self.__option_rects[self.__selected_index]
+        pygame.draw.circle(composed, Color.ANSWER_AREA_BORDER,
+                           (rect.right - 18 - area.x, rect.centery - area.y),
+                           10, 0)
+      option_list = (composed.convert_alpha(), area.topleft)
+      self.__option_lists[self.__selected_index] = option_list
+    return option_list
+
   def handle_combat_event(self, event: EventType) -> None:
     """
     Handles mouse events for option selection and button clicks.
@@ -683,6 +885,13 @@ class MultipleChoiceModal(BaseCombatModal):
           self.__selected_index = i
           return
 
+  def get_render_state(self) -> tuple:
+    """
+    Returns the visible state, including the selected option.
+    :return: Tuple of the modal's visible state.
+    """
+    return super().get_render_state() + (self.__selected_index,)
+
   def get_player_answer(self) -> str:
     """
     Returns the selected option as the player's answer.
@@ -722,66 +931,98 @@ class FillGapsModal(BaseCombatModal):
         self.get_rect().width - 40,
         36
     )
-    self.__cursor_visible = True
-    self.__cursor_counter = 0
+    self.__cursor_start = pygame.time.get_ticks()
+    self.__input_surface: Surface | None = None
+    self.__input_surface_text: str | None = None
+    self.__input_text_width = 0
+    self.__caret_surface = font.render("|", True,
+                                       Color.TITLE_TEXT).convert_alpha()
+    self.__overlay: Surface | None = None
     self.__font_path = font.path if hasattr(font, "path") else None
     self.__base_font = font
+    self.__title_surface = font.render("Completa el espacio en blanco:", True,
+                                       Color.TITLE_TEXT).convert_alpha()
+    question_surfaces = _render_text_multiline(
+        self.__question,
+        self.__font_path,
+        self.__base_font.get_height(),
+        self.get_rect().width - 40,
+        Color.TITLE_TEXT
+    )
+    self.__question_surfaces = [surf.convert_alpha()
+                                for surf in question_surfaces]
+
+  def __get_overlay(self, size: tuple[int, int]) -> Surface:
+    """
+    Returns the translucent overlay dimming the game behind the modal, creating
+    it again only if the window size changed.
+    :param size: Size of the surface the modal is drawn on.
+    :return: The overlay surface.
+    """
+    if self.__overlay is None or self.__overlay.get_size() != size:
+      self.__overlay = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+      self.__overlay.fill((0, 0, 0, 120))
+    return self.__overlay
 
   def draw(self, surface: Surface) -> None:
     """
     Draws the modal with a prompt, input box, and buttons.
     :param surface: The surface to draw on.
     """
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 120))
-    surface.blit(overlay, (0, 0))
+    surface.blit(self.__get_overlay(surface.get_size()), (0, 0))
 
     pygame.draw.rect(surface, Color.MODAL_BG, self.get_rect(), border_radius=12)
     pygame.draw.rect(surface, Color.WORD_BORDER, self.get_rect(), 2,
                      border_radius=12)
 
-    title = self.get_font().render("Completa el espacio en blanco:", True,
-                                   Color.TITLE_TEXT)
-    surface.blit(title, (self.get_rect().x + 20, self.get_rect().y + 18))
+    surface.blit(self.__title_surface,
+                 (self.get_rect().x + 20, self.get_rect().y + 18))
 
-    # Pregunta con ajuste de fuente y saltos de línea
-    question_max_width = self.get_rect().width - 40
-    question_surfaces = _render_text_multiline(
-        self.__question,
-        self.__font_path,
-        self.__base_font.get_height(),
-        question_max_width,
-        Color.TITLE_TEXT
-    )
     y_offset = self.get_rect().y + 60
-    for surf in question_surfaces:
+    for surf in self.__question_surfaces:
       surface.blit(surf, (self.get_rect().x + 20, y_offset))
       y_offset += surf.get_height() + 2
 
-    pygame.draw.rect(surface, Color.ANSWER_AREA_BG, self.__input_rect,
-                     border_radius=8)
-    pygame.draw.rect(surface, Color.ANSWER_AREA_BORDER, self.__input_rect, 2,
-                     border_radius=8)
-    input_display = self.__input_text
-    if self.__active_input and self.__cursor_visible:
-      input_display += "|"
-    input_txt = self.get_font().render(input_display, True, Color.TITLE_TEXT)
-    surface.blit(input_txt, (self.__input_rect.x + 8, self.__input_rect.y + 6))
-
+    self.draw_input(surface)
     self._draw_buttons(surface)
 
-    if self.get_result_text():
-      result_color = Color.CORRECT_ANSWER_BG if "Correcto" in self.get_result_text() else Color.WRONG_ANSWER_BG
-      result_surface = self.get_font().render(self.get_result_text(), True,
-                                              result_color)
+    result_surface = self.get_result_surface()
+    if result_surface:
       result_x = self.get_rect().x + 20
       result_y = self.get_confirm_button().bottom + 14
       surface.blit(result_surface, (result_x, result_y))
 
-    self.__cursor_counter += 1
-    if self.__cursor_counter > 30:
-      self.__cursor_visible = not self.__cursor_visible
-      self.__cursor_counter = 0
+  def draw_input(self, surface: Surface) -> Rect:
+    """
+    Draws the input box with the typed text and the blinking caret.
+    :param surface: The surface to draw on.
+    :return: The input box rectangle.
+    """
+    pygame.draw.rect(surface, Color.ANSWER_AREA_BG, self.__input_rect,
+                     border_radius=8)
+    pygame.draw.rect(surface, Color.ANSWER_AREA_BORDER, self.__input_rect, 2,
+                     border_radius=8)
+    # The text is only rendered again after it changed; the caret is separate.
+    if self.__input_surface_text != self.__input_text:
+      self.__input_surface = self.get_font().render(
+          self.__input_text, True, Color.TITLE_TEXT).convert_alpha()
+      self.__input_surface_text = self.__input_text
+      self.__input_text_width = self.get_font().size(self.__input_text)[0]
+    text_x, text_y = self.__input_rect.x + 8, self.__input_rect.y + 6
+    surface.blit(self.__input_surface, (text_x, text_y))
+    if self.__active_input and self.__is_cursor_visible():
+      surface.blit(self.__caret_surface,
+                   (text_x + self.__input_text_width, text_y))
+    return self.__input_rect
+
+  def __is_cursor_visible(self) -> bool:
+    """
+    Tells whether the blinking caret is currently shown. The blink follows the
+    clock, so it keeps its pace whatever the frame rate.
+    :return: True if the caret is visible.
+    """
+    elapsed = pygame.time.get_ticks() - self.__cursor_start
+    return (elapsed // _CURSOR_BLINK_MS) % 2 == 0
 
   def handle_combat_event(self, event: EventType) -> None:
     """
@@ -822,9 +1063,19 @@ class FillGapsModal(BaseCombatModal):
       self.set_confirmed(True)
     else:
       char = event.unicode
-      if len(char) == 1 and len(self.__input_text) < 40:
+      if char in _ANSWER_CHARS \
+          and len(self.__input_text) < _ANSWER_MAX_LENGTH:
         self.__input_text += char
 
+  def get_input_state(self) -> tuple:
+    """
+    Returns the input box state. It only changes on input or when the caret
+    blinks.
+    :return: Tuple of the input box's visible state.
+    """
+    return (self.__input_text, self.__active_input,
+            self.__active_input and self.__is_cursor_visible())
+
   def get_player_answer(self) -> str:
     """
     Returns the user's input as the answer.
@@ -837,7 +1088,7 @@ class FillGapsModal(BaseCombatModal):
     Resets the modal to initial state.
     """
     self.__active_input = True
-    self.__cursor_visible = True
+    self.__cursor_start = pygame.time.get_ticks()
     self.__input_text = ""
     self.set_confirmed(False)
     self.set_result_text("")
@@ -2,6 +2,7 @@
 
 import random
 from abc import ABC
+from typing import Callable
 
 import pygame
 from pygame import Surface
@@ -16,6 +17,19 @@ from lib.var import Var
 class Character(ABC):
   """Base class for all characters in the game."""
 
+  __slots__ = (
+    "__name", "__health", "__max_health", "__attack_power", "__speed",
+    "__attack_range", "__attack_range_sq", "__x", "__y", "__rect",
+    "__future_rect", "__image",
+    "__sprites", "__flipped_sprites", "__base_by_direction",
+    "__walking_sprites",
+    "__flipped_walking_sprites", "__walk_index", "__walk_frame_count",
+    "__walk_frame_delay_normal", "__walk_frame_delay_border",
+    "__walk_frame_delay", "__last_horizontal_direction", "__damage_timer",
+    "__DAMAGE_DISPLAY_FRAMES", "__attack_timer", "__ATTACK_DISPLAY_FRAMES",
+    "__attack_cooldown", "__attack_cooldown_timer", "__step_sounds",
+    "__step_channel", "__attack_hit_sounds", "__attack_miss_sounds")
+
   def __init__(self, name: str, health: int, attack_power: int,
       image_path: Surface, x: int = 0, y: int = 0,
       sprites: dict[str, Surface] = None, speed: int = 5,
@@ -44,20 +58,37 @@ class Character(ABC):
     self.__attack_power = attack_power
     self.__speed = speed
     self.__attack_range = attack_range
+    self.__attack_range_sq = attack_range * attack_range
     # Position and image
     self.__x = x
     self.__y = y
-    self.__image = pygame.transform.scale(image_path,
-                                          Var.DEFAULT_CHARACTER_SIZE)
+    # Kept in step with the position, so collision checks don't build Rects.
+    self.__rect = pygame.Rect(x, y, Var.DEFAULT_CHARACTER_SIZE[0],
+                              Var.DEFAULT_CHARACTER_SIZE[1])
+    # Scratch rect reused by the move probes instead of a new Rect per step.
+    self.__future_rect = self.__rect.copy()
+    self.__image = pygame.transform.scale(
+        image_path, Var.DEFAULT_CHARACTER_SIZE).convert_alpha()
     self.__sprites = {}
     if sprites is not None:
       for key, sprite in sprites.items():
-        self.__sprites[key] = pygame.transform.scale(sprite,
-                                                     Var.DEFAULT_CHARACTER_SIZE)
+        self.__sprites[key] = pygame.transform.scale(
+            sprite, Var.DEFAULT_CHARACTER_SIZE).convert_alpha()
     else:
       self.__sprites = {}
+    # Sprites face left; the mirrored copies are used when facing right.
+    self.__flipped_sprites = {
+      key: pygame.transform.flip(sprite, True, False)
+      for key, sprite in self.__sprites.items()}
+    # Sprite restored when an attack or damage animation ends, by direction.
+    base = self.__sprites.get("base", self.__image)
+    self.__base_by_direction = {
+      1: self.__flipped_sprites.get("base", pygame.transform.flip(base, True,
+                                                                  False)),
+      -1: base}
     # Walking animation
     self.__walking_sprites = []
+    self.__flipped_walking_sprites = []
     self.__walk_index = 0
     self.__walk_frame_count = 0
     self.__walk_frame_delay_normal = Var.WALK_FRAME_DELAY_NORMAL
@@ -98,6 +129,28 @@ class Character(ABC):
     """
     return self.__y
 
+  def get_position(self) -> tuple[int, int]:
+    """
+    Get both coordinates of the character at once.
+    :return: (x, y) coordinates
+    """
+    return self.__x, self.__y
+
+  def get_rect(self) -> pygame.Rect:
+    """
+    Get the area covered by the character. The Rect follows the character as it
+    moves, so it must not be modified by the caller.
+    :return: character rectangle
+    """
+    return self.__rect
+
+  def get_speed(self) -> int:
+    """
+    Get the distance the character moves per step.
+    :return: speed in pixels
+    """
+    return self.__speed
+
   def get_attack_range(self) -> int:
     """
     Get the attack range of the character.
@@ -156,17 +209,25 @@ class Character(ABC):
 
   def update_sprite_after_damage(self) -> None:
     """
-    Updates the sprite after damage timer expires.
+    Advances the attack, damage and cooldown timers, restoring the base sprite
+    when an attack or damage animation expires.
     """
     if not self.is_alive():
       self._set_dead_sprite()
       return
     if self.__attack_timer > 0:
-      self._handle_attack_timer()
+      self.__attack_timer -= 1
+      if self.__attack_timer == 0:
+        self.__image = self.__base_by_direction[
+          self.__last_horizontal_direction]
       return
     if self.__damage_timer > 0:
-      self._handle_damage_timer()
-    self._handle_attack_cooldown_timer()
+      self.__damage_timer -= 1
+      if self.__damage_timer == 0:
+        self.__image = self.__base_by_direction[
+          self.__last_horizontal_direction]
+    if self.__attack_cooldown_timer > 0:
+      self.__attack_cooldown_timer -= 1
 
   def _set_dead_sprite(self) -> None:
     """
@@ -174,61 +235,17 @@ class Character(ABC):
     """
     self.__image = self.__sprites.get("dead", self.__image)
 
-  def _handle_attack_timer(self) -> None:
-    """
-    Handle the attack timer and reset sprite after attack animation.
-    """
-    self.__attack_timer -= 1
-    if self.__attack_timer == 0:
-      base_sprite = self.__sprites.get("base", self.__image)
-      if self.__last_horizontal_direction == 1:
-        self.__image = pygame.transform.flip(base_sprite, True, False)
-      else:
-        self.__image = base_sprite
-
-  def _handle_damage_timer(self) -> None:
-    """
-    Handle the damage timer and reset sprite after damage animation.
-    """
-    self.__damage_timer -= 1
-    if self.__damage_timer == 0:
-      base_sprite = self.__sprites.get("base", self.__image)
-      if self.__last_horizontal_direction == 1:
-        self.__image = pygame.transform.flip(base_sprite, True, False)
-      else:
-        self.__image = base_sprite
-
-  def _handle_attack_cooldown_timer(self) -> None:
-    """
-    Handle the attack cooldown timer.
-    """
-    if self.__attack_cooldown_timer > 0:
-      self.__attack_cooldown_timer -= 1
-
   def can_attack(self, other: 'Character') -> bool:
     """
     Check if this character can attack another based on distance.
     :param other: another character
     :return: True if within attack range, else False
     """
-    self_center = (
-      self.__x + Var.DEFAULT_CHARACTER_SIZE[0] // 2,
-      self.__y + Var.DEFAULT_CHARACTER_SIZE[1] // 2
-    )
-    other_center = (
-      other.__x + Var.DEFAULT_CHARACTER_SIZE[0] // 2,
-      other.__y + Var.DEFAULT_CHARACTER_SIZE[1] // 2
-    )
-    dist = ((self_center[0] - other_center[0]) ** 2 +
-            (self_center[1] - other_center[1]) ** 2) ** 0.5
-
-    self_rect = pygame.Rect(self.__x, self.__y, Var.DEFAULT_CHARACTER_SIZE[0],
-                            Var.DEFAULT_CHARACTER_SIZE[1])
-    other_rect = pygame.Rect(other.__x, other.__y,
-                             Var.DEFAULT_CHARACTER_SIZE[0],
-                             Var.DEFAULT_CHARACTER_SIZE[1])
-
-    return dist <= self.__attack_range or self_rect.colliderect(other_rect)
+    # Both centers share the same half-size offset, so it cancels out.
+    dx = self.__x - other.__x
+    dy = self.__y - other.__y
+    return (dx * dx + dy * dy <= self.__attack_range_sq
+            or self.__rect.colliderect(other.__rect))
 
   def attack(self, other: 'Character') -> None:
     """
@@ -260,11 +277,21 @@ class Character(ABC):
     """
     Change the sprite to the attack sprite during an attack.
     """
-    attack_sprite = self.__sprites.get("attack", self.__image)
+    self.__image = self.__get_facing_sprite("attack")
+
+  def __get_facing_sprite(self, key: str) -> Surface:
+    """
+    Get a sprite facing the last horizontal direction.
+    :param key: sprite name
+    :return: the sprite, mirrored when facing right, or the current image if
+      the character has no such sprite
+    """
     if self.__last_horizontal_direction == 1:
-      self.__image = pygame.transform.flip(attack_sprite, True, False)
-    else:
-      self.__image = attack_sprite
+      sprite = self.__flipped_sprites.get(key)
+      if sprite is None:
+        sprite = pygame.transform.flip(self.__image, True, False)
+      return sprite
+    return self.__sprites.get(key, self.__image)
 
   def __str__(self) -> str:
     """
@@ -285,19 +312,23 @@ class Character(ABC):
     :param level: current game level for collision detection
     :param other_characters: list of other characters for collision detection
     """
-    new_x = self.__x + (dx * self.__speed if dx != 0 else 0)
+    if dx == 0:
+      return
+    new_x = self.__x + dx * self.__speed
     new_x = max(0, min(new_x, window_width - sprite_width))
-    future_rect_x = pygame.Rect(new_x, self.__y, sprite_width, sprite_height)
-    if level is not None and dx != 0 and level.check_collision(future_rect_x):
+    future_rect = self.__future_rect
+    future_rect.update(self.__x, self.__y, sprite_width, sprite_height)
+    future_rect.x = new_x
+    if level is not None and level.check_collision(future_rect):
       # Colisión con laberinto
       return
-    if other_characters is not None and dx != 0:
+    if other_characters is not None:
       for other in other_characters:
-        if other is not self and other.is_alive() and future_rect_x.colliderect(
-            pygame.Rect(other.__x, other.__y, sprite_width, sprite_height)):
+        if other is not self and other.is_alive() and future_rect.colliderect(
+            other.__rect):
           return
-    if dx != 0:
-      self.__x = new_x
+    self.__x = new_x
+    self.__rect.x = new_x
 
   def __try_move_y__(self, dy: int, window_height: int, sprite_width: int,
       sprite_height: int, level: Level,
@@ -311,19 +342,23 @@ class Character(ABC):
     :param level: current game level for collision detection
     :param other_characters: list of other characters for collision detection
     """
-    new_y = self.__y + (dy * self.__speed if dy != 0 else 0)
+    if dy == 0:
+      return
+    new_y = self.__y + dy * self.__speed
     new_y = max(0, min(new_y, window_height - sprite_height))
-    future_rect_y = pygame.Rect(self.__x, new_y, sprite_width, sprite_height)
-    if level is not None and dy != 0 and level.check_collision(future_rect_y):
+    future_rect = self.__future_rect
+    future_rect.update(self.__x, self.__y, sprite_width, sprite_height)
+    future_rect.y = new_y
+    if level is not None and level.check_collision(future_rect):
       # Colisión con laberinto
       return
-    if other_characters is not None and dy != 0:
+    if other_characters is not None:
       for other in other_characters:
-        if other is not self and other.is_alive() and future_rect_y.colliderect(
-            pygame.Rect(other.__x, other.__y, sprite_width, sprite_height)):
+        if other is not self and other.is_alive() and future_rect.colliderect(
+            other.__rect):
           return
-    if dy != 0:
-      self.__y = new_y
+    self.__y = new_y
+    self.__rect.y = new_y
 
   def move(self, dx: int, dy: int, moving: bool = False,
       window_width: int = 640, window_height: int = 480,
@@ -347,10 +382,9 @@ class Character(ABC):
       self.__try_move_y__(dy, window_height, sprite_width, sprite_height, level,
                           other_characters)
 
-      at_border = (
-          self.__x == 0 or self.__x == window_width - sprite_width or
-          self.__y == 0 or self.__y == window_height - sprite_height
-      )
+      # Moves are clamped to the window, so strictly inside means off-border.
+      at_border = not (0 < self.__x < window_width - sprite_width
+                       and 0 < self.__y < window_height - sprite_height)
       self.__walk_frame_delay = self.__walk_frame_delay_border if at_border else self.__walk_frame_delay_normal
 
       if moving:
@@ -376,21 +410,19 @@ class Character(ABC):
         step_sound = random.choice(self.__step_sounds)
         if step_sound and not self.__step_channel.get_busy():
           self.__step_channel.play(step_sound)
-    sprite = self.__walking_sprites[self.get_walk_index()]
     if self.__last_horizontal_direction == 1:
-      self.__image = pygame.transform.flip(sprite, True, False)
+      self.__image = self.__flipped_walking_sprites[self.__walk_index]
     else:
-      self.__image = sprite
+      self.__image = self.__walking_sprites[self.__walk_index]
 
   def _set_base_sprite(self) -> None:
     """
     Set the character's sprite to the base sprite.
     """
-    base_sprite = self.__sprites["base"]
     if self.__last_horizontal_direction == 1:
-      self.__image = pygame.transform.flip(base_sprite, True, False)
+      self.__image = self.__flipped_sprites["base"]
     else:
-      self.__image = base_sprite
+      self.__image = self.__sprites["base"]
 
   def draw_health_bar(self, surface: Surface) -> None:
     """
@@ -419,6 +451,23 @@ class Character(ABC):
     surface.blit(self.__image, (self.__x, self.__y))
     self.draw_health_bar(surface)
 
+  def get_draw_rect(self) -> pygame.Rect:
+    """
+    Get the screen area covered by the character's sprite and health bar.
+    :return: rectangle enclosing everything drawn by draw()
+    """
+    sprite_rect = self.__image.get_rect(topleft=(self.__x, self.__y))
+    return sprite_rect.union(
+        pygame.Rect(self.__x, self.__y - 8, Var.DEFAULT_CHARACTER_SIZE[0], 8))
+
+  def get_blit_args(self) -> tuple[Surface, tuple[int, int]]:
+    """
+    Get the current image and position as a (source, dest) pair for
+    Surface.blits.
+    :return: tuple of current image and top-left position
+    """
+    return self.__image, (self.__x, self.__y)
+
   def get_sprites(self) -> dict[str, Surface]:
     """
     Get the character's sprites.
@@ -432,6 +481,8 @@ class Character(ABC):
     :param sprites: list of walking sprite surfaces
     """
     self.__walking_sprites = sprites
+    self.__flipped_walking_sprites = [
+      pygame.transform.flip(sprite, True, False) for sprite in sprites]
 
   def get_step_sounds(self) -> list[SoundType]:
     """
@@ -458,6 +509,8 @@ class Character(ABC):
 class Hero(Character):
   """Class representing the hero character."""
 
+  __slots__ = ()
+
   def __init__(self, x: int = 0, y: int = 0, health: int = 100) -> None:
     """
     Initializes the hero with default attributes and sprites.
@@ -506,6 +559,8 @@ class Hero(Character):
 class Zombie(Character):
   """Class representing a zombie enemy."""
 
+  __slots__ = ("__on_death",)
+
   def __init__(self, x: int = 0, y: int = 0, health: int = 10) -> None:
     """
     Initializes the zombie with default attributes and sprites.
@@ -530,3 +585,21 @@ class Zombie(Character):
       self.get_sprites()["walking_3"]
     ])
     self.set_step_sounds([])
+    self.__on_death: Callable[['Zombie'], None] | None = None
+
+  def set_on_death(self, callback: Callable[['Zombie'], None]) -> None:
+    """
+    Set the function called once when the zombie dies.
+    :param callback: function receiving the dead zombie
+    """
+    self.__on_death = callback
+
+  def receive_damage(self, amount: int) -> None:
+    """
+    Receives damage and notifies the death callback if the zombie dies.
+    :param amount: damage amount
+    """
+    was_alive = self.is_alive()
+    super().receive_damage(amount)
+    if was_alive and not self.is_alive() and self.__on_death is not None:
+      self.__on_death(self)
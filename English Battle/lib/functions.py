@@ -8,10 +8,10 @@ from pygame import Surface
 from pygame.font import Font
 from pygame.mixer import Channel
 
-from font import FONTS
+from font import FONTS, load_font
 from lib.color import Color
 from lib.combat import ScoreSystem
-from lib.core import Zombie, Hero
+from lib.core import Character, Zombie, Hero
 from lib.level import (Level, TutorialLevel, TutorialCombatLevel,
                        TutorialMoveLevel, TutorialHealLevel, LevelType,
                        FeedbackBox)
@@ -20,6 +20,19 @@ from lib.var import Var
 from sound import SOUNDS, MUSIC
 from sprite.backgrounds import BACKGROUNDS
 
+_text_cache: dict[tuple[Font, str, tuple[int, int, int]], Surface] = {}
+_TEXT_CACHE_MAX_SIZE: int = 256
+_last_drawn_level: Optional[Level] = None
+_last_full_redraw: bool = True
+_last_dirty_rects: list[pygame.Rect] = []
+_last_scene_state: Optional[tuple] = None
+_input_only_redraw: bool = False
+_LEVEL_TYPES: dict[str, LevelType] = {
+  level_type.value: level_type for level_type in LevelType}
+_HALF_WINDOW_WIDTH: int = Var.DEFAULT_WINDOW_SIZE[0] // 2
+# The window lost its contents (restored, uncovered), so it must be redrawn.
+EXPOSE_EVENTS: tuple[int, int] = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
 
 def create_level_from_config(config: dict, hero: 'Hero') -> Level:
   """
@@ -79,84 +92,183 @@ def close_game() -> None:
   sys.exit()
 
 
-def find_attackable_zombie(hero: Hero, zombies: list[Zombie]) -> Optional[
-  Zombie]:
+def find_target_zombie(hero: Hero, zombies: list[Zombie]) -> Optional[Zombie]:
   """
-  Finds the closest zombie within attack range.
+  Finds the zombie the hero should attack in a single pass: the closest one.
+  If any zombie is within attack range, the closest zombie is one of them, so
+  no separate in-range search is needed.
   :param hero: The hero character.
-  :param zombies: List of zombies to check.
-  :return: The closest attackable zombie or None if none are in range.
+  :param zombies: List of living zombies to check.
+  :return: The closest zombie or None if the list is empty.
   """
-  min_dist = float('inf')
-  target = None
-  for zombie in zombies:
-    if zombie.is_alive():
-      hero_center = (hero.get_x() + 23 // 2, hero.get_y() + 30 // 2)
-      zombie_center = (zombie.get_x() + 23 // 2, zombie.get_y() + 30 // 2)
-      dist = ((hero_center[0] - zombie_center[0]) ** 2 +
-              (hero_center[1] - zombie_center[1]) ** 2) ** 0.5
-      if dist <= hero.get_attack_range() and dist < min_dist:
-        target = zombie
-        min_dist = dist
-  return target
+  # Both centers share the same offset, so it cancels out of the difference.
+  hx, hy = hero.get_position()
+
+  def squared_distance(zombie: Zombie) -> int:
+    zx, zy = zombie.get_position()
+    dx = zx - hx
+    dy = zy - hy
+    return dx * dx + dy * dy
 
+  return min(zombies, key=squared_distance, default=None)
 
-def find_closest_zombie(hero: Hero, zombies: list[Zombie]) -> Optional[
-  Zombie]:
+
+def render_cached(font: Font, text: str,
+    color: tuple[int, int, int]) -> Surface:
   """
-  Finds the closest zombie (regardless of range).
-  :param hero: The hero character.
-  :param zombies: List of zombies to check.
-  :return: The closest zombie or None if no zombies are alive.
+  Renders antialiased text, reusing the surface rendered by an earlier call
+  with the same font, text and color.
+  :param font: The font to render with.
+  :param text: The text to render.
+  :param color: The text color.
+  :return: The rendered text surface.
   """
-  min_dist = float('inf')
-  closest = None
-  for zombie in zombies:
-    if zombie.is_alive():
-      hero_center = (hero.get_x() + 23 // 2, hero.get_y() + 30 // 2)
-      zombie_center = (zombie.get_x() + 23 // 2, zombie.get_y() + 30 // 2)
-      dist = ((hero_center[0] - zombie_center[0]) ** 2 +
-              (hero_center[1] - zombie_center[1]) ** 2) ** 0.5
-      if dist < min_dist:
-        closest = zombie
-        min_dist = dist
-  return closest
+  key = (font, text, color)
+  surface = _text_cache.get(key)
+  if surface is None:
+    if len(_text_cache) >= _TEXT_CACHE_MAX_SIZE:
+      _text_cache.clear()
+    surface = font.render(text, True, color).convert_alpha()
+    _text_cache[key] = surface
+  return surface
+
+
+def get_font(name: str, size: int) -> Font:
+  """
+  Returns one of the game fonts at the given size, loading it on first use.
+  :param name: Font name, as listed in FONTS.
+  :param size: Font size in points.
+  :return: The loaded font.
+  """
+  return load_font(FONTS.get(name), size)
+
+
+def get_score_font() -> Font:
+  """
+  Returns the font used for the in-game score, loading it on first use.
+  :return: The score font.
+  """
+  return get_font("press-start-2p", 12)
+
+
+def draw_characters(window: Surface, characters: list[Character]) -> None:
+  """
+  Draws several characters with a single batched blit, then their health bars.
+  :param window: The Pygame window surface.
+  :param characters: Characters to draw, in back-to-front order.
+  """
+  window.blits([c.get_blit_args() for c in characters], doreturn=False)
+  for character in characters:
+    character.draw_health_bar(window)
 
 
-def draw_game(lvl: Level, window: Surface, hero: Hero,
-    zombies: list[Zombie]) -> None:
+def draw_game(lvl: Level, window: Surface, hero: Hero) -> None:
   """
   Draws all game elements on the window.
   :param lvl: The current game level.
   :param window: The Pygame window surface.
   :param hero: The hero character.
-  :param zombies: List of zombies in the level.
   """
+  global _last_drawn_level, _last_full_redraw, _last_dirty_rects
+  global _input_only_redraw
+  if _input_only_redraw:
+    _input_only_redraw = False
+    # The rest of the screen still shows the previous frame.
+    input_rect = lvl.get_combat_modal().draw_input(window)
+    if input_rect is not None:
+      pygame.display.update(input_rect)
+      return
   lvl.draw_background(window)
   lvl.draw_maze(window)
-  for zombie in zombies:
-    if not zombie.is_alive():
-      zombie.draw(window)
-  hero.draw(window)
-  for zombie in zombies:
-    if zombie.is_alive():
-      zombie.draw(window)
+  # One batch keeps every health bar above every sprite.
+  draw_characters(window, [*lvl.get_dead_zombies(), hero,
+                           *lvl.get_alive_zombies()])
+  # Dead zombies never change, so only living characters can dirty the screen.
+  dirty_rects = [hero.get_draw_rect()]
+  dirty_rects.extend(z.get_draw_rect() for z in lvl.get_alive_zombies())
+  dirty_rects.extend(lvl.get_object_rects())
 
   combat = lvl.get_combat_instance()
   combat_modal = lvl.get_combat_modal()
-  if combat is not None and combat.get_active() and combat_modal:
+  modal_active = combat is not None and combat.get_active() and combat_modal
+  if modal_active:
     combat_modal.draw(window)
-  FeedbackBox.get_instance().draw(window)
+  feedback_box = FeedbackBox.get_instance()
+  feedback_box.draw(window)
+  if feedback_box.get_drawn_rect():
+    dirty_rects.append(feedback_box.get_drawn_rect())
   lvl.draw_pause_menu(window)
 
   if Var.score_system:
-    font = pygame.font.Font(FONTS.get("press-start-2p"), 12)
-    score_text = font.render(f"{Var.score_system.get_score()}", True,
-                             (255, 255, 255))
-    window.blit(score_text,
-                (Var.DEFAULT_WINDOW_SIZE[0] - score_text.get_width() - 24, 16))
+    score_text = render_cached(get_score_font(),
+                               f"{Var.score_system.get_score()}",
+                               (255, 255, 255))
+    dirty_rects.append(window.blit(
+        score_text,
+        (Var.DEFAULT_WINDOW_SIZE[0] - score_text.get_width() - 24, 16)))
+
+  # Overlays cover most of the screen, and whatever was on screen before
+  # (a menu, another level, a closed overlay) is unknown, so push it all.
+  full_redraw = modal_active or lvl.get_pause_menu().get_active()
+  if full_redraw or _last_full_redraw or lvl is not _last_drawn_level:
+    pygame.display.flip()
+  else:
+    pygame.display.update(_last_dirty_rects + dirty_rects)
+  _last_drawn_level = lvl
+  _last_full_redraw = bool(full_redraw)
+  _last_dirty_rects = dirty_rects
 
-  pygame.display.flip()
+
+def scene_needs_redraw(lvl: Level, hero: Hero) -> bool:
+  """
+  Tells whether anything visible changed since the last call, so idle frames
+  can skip draw_game entirely.
+  :param lvl: The current game level.
+  :param hero: The hero character.
+  :return: True if the frame must be drawn.
+  """
+  global _last_scene_state, _input_only_redraw
+  door = lvl.get_door()
+  # These are animated or timed inside their draw calls, so they need every
+  # frame while they are on screen.
+  if FeedbackBox.get_instance().get_message() \
+      or (door and door.get_state() == "opening"):
+    _last_scene_state = None
+    return True
+  combat = lvl.get_combat_instance()
+  modal = lvl.get_combat_modal() \
+    if combat is not None and combat.get_active() else None
+  pause_menu = lvl.get_pause_menu()
+  # Medkit pickups always change the hero's health, so they need no entry.
+  state = (
+    lvl,
+    hero.get_blit_args(), hero.get_health(),
+    tuple((z.get_blit_args(), z.get_health())
+          for z in lvl.get_alive_zombies()),
+    door.get_state() if door else None,
+    Var.score_system.get_score() if Var.score_system else None,
+    modal, modal.get_render_state() if modal else None,
+    pause_menu.get_render_state() if pause_menu.get_active() else None,
+    modal.get_input_state() if modal else None
+  )
+  if state == _last_scene_state:
+    return False
+  # The pause menu would be covered by the input box, so it needs a full draw.
+  _input_only_redraw = (_last_scene_state is not None
+                        and not pause_menu.get_active()
+                        and state[:-1] == _last_scene_state[:-1])
+  _last_scene_state = state
+  return True
+
+
+def force_scene_redraw() -> None:
+  """
+  Makes the next frame draw and push the whole scene, even if nothing in it
+  changed. Used after the window was exposed and its contents were lost.
+  """
+  global _last_scene_state, _last_drawn_level
+  _last_scene_state = None
+  _last_drawn_level = None
 
 
 def check_advance_level(lvl: Level, hero: Hero, window: Surface) -> None:
@@ -168,9 +280,7 @@ def check_advance_level(lvl: Level, hero: Hero, window: Surface) -> None:
   """
   door: Door = lvl.get_door()
   if door and door.get_state() == "open":
-    hero_rect = pygame.Rect(hero.get_x(), hero.get_y(), 23, 30)
-    door_rect = pygame.Rect(door.get_x(), door.get_y(), 10, 14)
-    if hero_rect.colliderect(door_rect):
+    if hero.get_rect().colliderect(door.get_entry_rect()):
       sound = SOUNDS.get("latchunlocked2")
       transition_black_screen(window)
       if sound:
@@ -189,22 +299,39 @@ def main_menu(window: Surface) -> None:
   Displays the main menu and handles navigation.
   :param window: The pygame window surface.
   """
-  font_title = pygame.font.Font(FONTS.get("retro-british"), 32)
-  font_menu = pygame.font.Font(FONTS.get("press-start-2p"), 16)
-  bg_img = pygame.transform.scale(random.choice(list(BACKGROUNDS.items()))[1],
-                                  Var.DEFAULT_WINDOW_SIZE)
+  font_title = get_font("retro-british", 32)
+  font_menu = get_font("press-start-2p", 16)
+  bg_img = dim_background(
+      pygame.transform.scale(random.choice(list(BACKGROUNDS.items()))[1],
+                             Var.DEFAULT_WINDOW_SIZE))
   options = ["Nuevo juego", "Salir"]
+  title = font_title.render("English Battle", True, Color.TEXT).convert_alpha()
+  option_surfaces = [
+    _render_menu_option(font_menu, opt, Color.MENU_UNSELECTED_BTN,
+                        Color.MENU_SELECTED_BTN)
+    for opt in options]
   idx_selected = 0
   channel: Channel = Var.SFX_CHANNEL
+  blip: pygame.mixer.Sound = SOUNDS["blip1"]
   menu_active = True
   selected_level = False
+  full_update = True
+  drawn_idx: Optional[int] = None
+  clock = pygame.time.Clock()
   while menu_active:
-    draw_menu(window, font_title, font_menu, bg_img, idx_selected, options)
+    # The menu is static between key presses, so only draw after a change.
+    if full_update or idx_selected != drawn_idx:
+      draw_menu(window, bg_img, idx_selected, title, option_surfaces,
+                full_update)
+      full_update = False
+      drawn_idx = idx_selected
     for event in pygame.event.get():
       if event.type == pygame.QUIT:
         close_game()
+      elif event.type in EXPOSE_EVENTS:
+        full_update = True
       elif event.type == pygame.KEYDOWN:
-        channel.play(SOUNDS["blip1"])
+        channel.play(blip)
         if event.key == pygame.K_UP:
           idx_selected = (idx_selected - 1) % len(options)
         elif event.key == pygame.K_DOWN:
@@ -215,6 +342,7 @@ def main_menu(window: Surface) -> None:
             Var.current_level_idx = level_select_menu(window, bg_img)
             if Var.current_level_idx is None:
               selected_level = False
+              full_update = True
               continue
             Var.character, Var.level, Var.zombies = setup_level(
                 Var.current_level_idx)
@@ -224,6 +352,7 @@ def main_menu(window: Surface) -> None:
             close_game()
     if selected_level:
       menu_active = False
+    clock.tick(60)
 
 
 def init_score_system() -> ScoreSystem:
@@ -261,69 +390,112 @@ def setup_level(level_idx: int) -> tuple[Hero, Level, list[Zombie]]:
   return character, level, zombies
 
 
-def draw_menu(menu_window: Surface, menu_font: Font, title_font: Font,
+def dim_background(background_img: Surface) -> Surface:
+  """
+  Returns a copy of a menu background with the translucent black overlay
+  already composited on it.
+  :param background_img: Background image for the menu.
+  :return: The dimmed background surface.
+  """
+  dimmed_bg = background_img.copy()
+  dark = pygame.Surface(Var.DEFAULT_WINDOW_SIZE)
+  dark.set_alpha(180)
+  dark.fill((0, 0, 0))
+  dimmed_bg.blit(dark, (0, 0))
+  return dimmed_bg.convert()
+
+
+def _render_menu_option(font: Font, text: str,
+    color: tuple[int, int, int],
+    selected_color: tuple[int, int, int]) -> tuple[Surface, Surface, int]:
+  """
+  Pre-renders a menu option in both of its states.
+  :param font: The font to render with.
+  :param text: The option text.
+  :param color: Text color when the option is not selected.
+  :param selected_color: Text color when the option is selected.
+  :return: The unselected and selected surfaces and the x offset that centers
+    them in the window. Both states share the same text, and so the same width.
+  """
+  unselected_txt = font.render(text, True, color).convert_alpha()
+  selected_txt = font.render(text, True, selected_color).convert_alpha()
+  return (unselected_txt, selected_txt,
+          _HALF_WINDOW_WIDTH - unselected_txt.get_width() // 2)
+
+
+def draw_menu(menu_window: Surface,
     background_img: Surface,
     selected_idx: int,
-    options) -> None:
+    title: Surface,
+    options: list[tuple[Surface, Surface, int]],
+    full_update: bool = True) -> None:
   """
   Draws main menu.
   :param menu_window: The pygame window surface.
-  :param title_font: font for the title.
-  :param menu_font: font for the menu options.
-  :param background_img: Background image for the menu.
+  :param background_img: Dimmed background image for the menu.
   :param selected_idx: Index of the currently selected option.
-  :param options: List of menu option strings.
+  :param title: Pre-rendered menu title.
+  :param options: Pre-rendered (unselected, selected, x) text of each option.
+  :param full_update: Whether to push the whole window to the screen. When
+    False only the options, the one part that can change, are pushed.
   """
   menu_window.blit(background_img, (0, 0))
-  overlay = pygame.Surface(Var.DEFAULT_WINDOW_SIZE)
-  overlay.set_alpha(180)
-  overlay.fill((0, 0, 0))
-  menu_window.blit(overlay, (0, 0))
-  title = menu_font.render("English Battle", True, Color.TEXT)
   menu_window.blit(title,
-                   (Var.DEFAULT_WINDOW_SIZE[0] // 2 - title.get_width() // 2,
-                    60))
-  for idx, opt in enumerate(options):
-    color = Color.MENU_SELECTED_BTN if idx == selected_idx else Color.MENU_UNSELECTED_BTN
-    txt = title_font.render(opt, True, color)
-    x = Var.DEFAULT_WINDOW_SIZE[0] // 2 - txt.get_width() // 2
+                   (_HALF_WINDOW_WIDTH - title.get_width() // 2, 60))
+  option_rects = []
+  for idx, (unselected_txt, selected_txt, x) in enumerate(options):
+    txt = selected_txt if idx == selected_idx else unselected_txt
     y = 160 + idx * 60
-    menu_window.blit(txt, (x, y))
-  pygame.display.flip()
+    option_rects.append(menu_window.blit(txt, (x, y)))
+  if full_update:
+    pygame.display.flip()
+  else:
+    pygame.display.update(option_rects)
 
 
 def get_level_type(type_str: str) -> LevelType:
   """Returns the LevelType enum from string."""
-  if type_str == "multiple_choice":
-    return LevelType.MULTIPLE_CHOICE
-  elif type_str == "word_ordering":
-    return LevelType.WORD_ORDERING
-  elif type_str == "fill_in_the_blank":
-    return LevelType.FILL_IN_THE_BLANK
-  else:
-    return LevelType.MULTIPLE_CHOICE
+  return _LEVEL_TYPES.get(type_str, LevelType.MULTIPLE_CHOICE)
 
 
 def level_select_menu(window: Surface, bg_img: Surface) -> Optional[int]:
   """Displays the level selection menu and handles navigation."""
   levels = [lvl["name"] for lvl in Var.LEVELS_CONFIG]
   levels.append("Volver")
+  title_font = get_font("press-start-2p", 20)
+  level_font = get_font("press-start-2p", 10)
+  title = title_font.render("Selecciona nivel", True,
+                            Color.TEXT).convert_alpha()
+  level_surfaces = [
+    _render_menu_option(level_font, lvl, Color.TEXT, Color.HIGHLIGHT_TEXT)
+    for lvl in levels]
   selected = 0
   level_selected = False
   channel: Channel = Var.SFX_CHANNEL
+  blip: pygame.mixer.Sound = SOUNDS["blip1"]
+  full_update = True
+  drawn_idx: Optional[int] = None
+  clock = pygame.time.Clock()
   while not level_selected:
-    draw_level_select(window, bg_img, selected, levels)
+    if full_update or selected != drawn_idx:
+      draw_level_select(window, bg_img, selected, title, level_surfaces,
+                        full_update)
+      full_update = False
+      drawn_idx = selected
     for event in pygame.event.get():
       if event.type == pygame.QUIT:
         close_game()
+      elif event.type in EXPOSE_EVENTS:
+        full_update = True
       elif event.type == pygame.KEYDOWN:
-        channel.play(SOUNDS["blip1"])
+        channel.play(blip)
         if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
           selected = (selected - 1) % len(levels)
         elif event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
           selected = (selected + 1) % len(levels)
         elif event.key == pygame.K_RETURN:
           level_selected = True
+    clock.tick(60)
   if levels[selected] == "Volver":
     return None
   return selected
@@ -332,24 +504,22 @@ def level_select_menu(window: Surface, bg_img: Surface) -> Optional[int]:
 def draw_level_select(win: Surface,
     background_img: Surface,
     selected_idx: int,
-    levels: dict[str, int]) -> None:
+    title: Surface,
+    levels: list[tuple[Surface, Surface, int]],
+    full_update: bool = True) -> None:
   """
   Draws level selection menu.
   :param win: The pygame window surface.
-  :param background_img: Background image for the menu.
+  :param background_img: Dimmed background image for the menu.
   :param selected_idx: Index of the currently selected level.
-  :param levels: List of level names.
+  :param title: Pre-rendered menu title.
+  :param levels: Pre-rendered (unselected, selected, x) name of each level.
+  :param full_update: Whether to push the whole window to the screen. When
+    False only the band holding the level list is pushed.
   """
   win.blit(background_img, (0, 0))
-  overlay = pygame.Surface(Var.DEFAULT_WINDOW_SIZE)
-  overlay.set_alpha(180)
-  overlay.fill((0, 0, 0))
-  win.blit(overlay, (0, 0))
-  title_font = pygame.font.Font(FONTS.get("press-start-2p"), 20)
-  level_font = pygame.font.Font(FONTS.get("press-start-2p"), 10)
-  title = title_font.render("Selecciona nivel", True, Color.TEXT)
   win.blit(title,
-           (Var.DEFAULT_WINDOW_SIZE[0] // 2 - title.get_width() // 2, 60))
+           (_HALF_WINDOW_WIDTH - title.get_width() // 2, 60))
 
   max_visible = 7
   half = max_visible // 2
@@ -357,16 +527,18 @@ def draw_level_select(win: Surface,
   end_idx = min(len(levels), start_idx + max_visible)
   if end_idx - start_idx < max_visible:
     start_idx = max(0, end_idx - max_visible)
-  visible_levels = levels[start_idx:end_idx]
 
-  for idx, lvl in enumerate(visible_levels):
-    real_idx = start_idx + idx
-    color = Color.HIGHLIGHT_TEXT if real_idx == selected_idx else Color.TEXT
-    txt = level_font.render(lvl, True, color)
-    x = Var.DEFAULT_WINDOW_SIZE[0] // 2 - txt.get_width() // 2
+  for idx, real_idx in enumerate(range(start_idx, end_idx)):
+    unselected_txt, selected_txt, x = levels[real_idx]
+    txt = selected_txt if real_idx == selected_idx else unselected_txt
     y = 160 + idx * 36
     win.blit(txt, (x, y))
-  pygame.display.flip()
+  if full_update:
+    pygame.display.flip()
+  else:
+    # The list scrolls, so every visible row can change, including its width.
+    pygame.display.update(pygame.Rect(0, 160, Var.DEFAULT_WINDOW_SIZE[0],
+                                      max_visible * 36))
 
 
 def play_music() -> None:
@@ -379,7 +551,8 @@ def play_music() -> None:
 
 def update_all_sprites(character: Hero, zombies: list[Zombie]) -> None:
   """
-  Updates all character sprites.
+  Updates all character sprites. Dead zombies keep their dead sprite, so only
+  living ones need to be passed.
   :param character: The hero character.
   :param zombies: List of zombie characters.
   """
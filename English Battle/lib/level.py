@@ -9,7 +9,7 @@ from pygame.event import EventType
 from pygame.font import FontType
 from pygame.mixer import Channel
 
-from font import FONTS
+from font import FONTS, load_font
 from sound import SOUNDS
 from sprite.backgrounds import BACKGROUNDS
 from sprite.levels import DOOR_1_SPRITES, MEDKIT_SPRITES
@@ -27,6 +27,94 @@ class LevelType(Enum):
   MULTIPLE_CHOICE = "multiple_choice"
 
 
+class SpatialHash:
+  """Grid of cells used to find characters near an area without scanning all."""
+
+  def __init__(self, cell_size: int = 64) -> None:
+    """
+    Initializes an empty grid.
+    :param cell_size: Width and height of each cell in pixels.
+    """
+    self.__cell_size: int = cell_size
+    self.__cells: dict[tuple[int, int], list['Character']] = {}
+    self.__keys: dict[int, list[tuple[int, int]]] = {}
+
+  def __cells_for(self, rect: Rect) -> list[tuple[int, int]]:
+    """
+    Returns the keys of every cell the rectangle overlaps.
+    :param rect: Area to look up.
+    :return: List of (column, row) cell keys.
+    """
+    size = self.__cell_size
+    return [(cx, cy)
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1)
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)]
+
+  def __keys_of(self, character: 'Character') -> list[tuple[int, int]]:
+    """
+    Returns the keys of every cell the character currently overlaps.
+    :param character: Character to look up.
+    :return: List of (column, row) cell keys.
+    """
+    width, height = Var.DEFAULT_CHARACTER_SIZE
+    return self.__cells_for(
+        Rect(character.get_position(), (width, height)))
+
+  def add(self, character: 'Character') -> None:
+    """
+    Inserts a character at its current position.
+    :param character: Character to index.
+    """
+    keys = self.__keys_of(character)
+    self.__keys[id(character)] = keys
+    for key in keys:
+      self.__cells.setdefault(key, []).append(character)
+
+  def remove(self, character: 'Character') -> None:
+    """
+    Removes a character from the grid, if indexed.
+    :param character: Character to remove.
+    """
+    for key in self.__keys.pop(id(character), ()):
+      bucket = self.__cells[key]
+      bucket.remove(character)
+      if not bucket:
+        del self.__cells[key]
+
+  def update(self, character: 'Character') -> None:
+    """
+    Re-indexes a character after it moved. Nothing is done unless the move
+    took it across a cell border.
+    :param character: Character that moved.
+    """
+    keys = self.__keys_of(character)
+    if keys != self.__keys.get(id(character)):
+      self.remove(character)
+      self.add(character)
+
+  def rebuild(self, characters: list['Character']) -> None:
+    """
+    Clears the grid and inserts the given characters at their positions.
+    :param characters: Characters to index.
+    """
+    self.__cells = {}
+    self.__keys = {}
+    for character in characters:
+      self.add(character)
+
+  def query(self, rect: Rect) -> list['Character']:
+    """
+    Returns the characters indexed in any cell the rectangle overlaps.
+    :param rect: Area to look up.
+    :return: List of nearby characters, without duplicates.
+    """
+    found: dict[int, 'Character'] = {}
+    for key in self.__cells_for(rect):
+      for character in self.__cells.get(key, ()):
+        found[id(character)] = character
+    return list(found.values())
+
+
 class Level:
   """Class to manage the game level, including background and maze."""
 
@@ -51,9 +139,11 @@ class Level:
     self.__background_name: str = background_name
     self.__background: Surface = pygame.transform.scale(
         BACKGROUNDS[self.__background_name], self.__window_size
-    )
+    ).convert()
     self.__maze_walls: list[Rect] = self._generate_random_maze(
         self.__window_size)
+    self.__free_spawn_cells: list[tuple[int, int]] = \
+      self._find_free_spawn_cells()
     self.__difficulty: int = difficulty
     self.__level_type: LevelType = level_type
     self.__questions_set = Var.QUESTIONS.get(self.__difficulty, {}).get(
@@ -66,7 +156,11 @@ class Level:
     self.__wall_color = wall_color
     self.__hero = hero
     self.__pause_menu = None
-    self.__pause_menu_font = pygame.font.Font(FONTS.get("press-start-2p"), 12)
+    self.__alive_zombies: list['Zombie'] = []
+    self.__dead_zombies: list['Zombie'] = []
+    self.__zombie_grid: SpatialHash = SpatialHash()
+    self.__pause_menu_font = load_font(FONTS.get("press-start-2p"), 12)
+    self.__static_background: Surface = self._build_static_background()
 
   def get_level_type(self) -> LevelType:
     """
@@ -244,20 +338,48 @@ class Level:
                                    vertical_walls, horizontal_walls)
     return walls
 
+  def _find_free_spawn_cells(self,
+      step: int = Var.DEFAULT_SPAWN_STEP) -> list[tuple[int, int]]:
+    """
+    Finds every position on a grid where a character fits without touching
+    the maze walls.
+    :param step: Distance in pixels between grid positions.
+    :return: List of (x, y) positions free of walls.
+    """
+    sprite_w, sprite_h = Var.DEFAULT_CHARACTER_SIZE
+    rect = pygame.Rect(0, 0, sprite_w, sprite_h)
+    free_cells: list[tuple[int, int]] = []
+    for y in range(0, self.__window_size[1] - sprite_h + 1, step):
+      for x in range(0, self.__window_size[0] - sprite_w + 1, step):
+        rect.topleft = (x, y)
+        if rect.collidelist(self.__maze_walls) == -1:
+          free_cells.append((x, y))
+    return free_cells
+
+  def _build_static_background(self) -> Surface:
+    """
+    Composites the background image and the maze walls, which never change
+    during a level, into a single surface.
+    :return: Surface with the background and walls already drawn.
+    """
+    static_background = self.__background.copy()
+    for wall in self.__maze_walls:
+      pygame.draw.rect(static_background, self.__wall_color, wall)
+    return static_background
+
   def draw_background(self, surface: Surface) -> None:
     """
-    Draws the background image on the given surface.
+    Draws the background image and the maze walls on the given surface.
     :param surface: Pygame Surface to draw the background on.
     """
-    surface.blit(self.__background, (0, 0))
+    surface.blit(self.__static_background, (0, 0))
 
   def draw_maze(self, surface: Surface) -> None:
     """
-    Draws the maze walls and the door on the given surface.
+    Draws the door and medkits on the given surface. The walls are already
+    part of the background drawn by draw_background.
     :param surface: Pygame Surface to draw the maze on.
     """
-    for wall in self.__maze_walls:
-      pygame.draw.rect(surface, self.__wall_color, wall)
     if self.__door:
       if self.__door.get_state() == "opening":
         self.__door.animate_opening()
@@ -266,15 +388,23 @@ class Level:
       if not medkit.get_used():
         medkit.draw(surface)
 
+  def get_object_rects(self) -> list[Rect]:
+    """
+    Returns the screen areas of the door and medkits, which can change
+    between frames.
+    :return: List of Rect objects.
+    """
+    rects = [medkit.get_rect() for medkit in self.__medkits]
+    if self.__door:
+      rects.append(self.__door.get_rect())
+    return rects
+
   def check_collision(self, rect: Rect) -> bool:
     """
     Returns True if rect collides with any maze wall.
     :param rect: Pygame Rect to check for collisions.
     """
-    for wall in self.__maze_walls:
-      if rect.colliderect(wall):
-        return True
-    return False
+    return rect.collidelist(self.__maze_walls) != -1
 
   @staticmethod
   def play_death_sounds() -> None:
@@ -293,45 +423,106 @@ class Level:
 
   def generate_zombies(self, num_zombies: int) -> list['Zombie']:
     """
-    Generates zombies at random positions not colliding with walls.
+    Generates zombies at random positions not colliding with walls, the hero
+    or each other. Each free cell is tried at most once.
     :param num_zombies: Number of zombies to generate.
     :return: List of zombie objects.
     """
     from lib.core import Zombie
     zombies: list[Zombie] = []
-    sprite_w, sprite_h = (23, 30)
-    x: int = 0
-    y: int = 0
-    for _ in range(num_zombies):
-      valid_spawn = False
-      while not valid_spawn:
-        x = random.randint(0, self.__window_size[0] - sprite_w)
-        y = random.randint(0, self.__window_size[1] - sprite_h)
-        rect = pygame.Rect(x, y, sprite_w, sprite_h)
-        if not self.check_collision(rect):
-          valid_spawn = True
-      health = 10 + (self.__difficulty - 1) * 5
-      zombies.append(Zombie(x, y, health=health))
+    size = Var.DEFAULT_CHARACTER_SIZE
+    health = 10 + (self.__difficulty - 1) * 5
+    candidates = list(self.__free_spawn_cells)
+    taken = [Rect(self.__hero.get_position(), size)]
+    while len(zombies) < num_zombies and candidates:
+      idx = random.randrange(len(candidates))
+      x, y = candidates[idx]
+      candidates[idx] = candidates[-1]
+      candidates.pop()
+      rect = Rect(x, y, *size)
+      if rect.collidelist(taken) == -1:
+        taken.append(rect)
+        zombies.append(Zombie(x, y, health=health))
+    return self._track_zombies(zombies)
+
+  def _track_zombies(self, zombies: list['Zombie']) -> list['Zombie']:
+    """
+    Registers the level's zombies, splitting them into alive and dead lists
+    that are kept up to date as zombies die.
+    :param zombies: List of zombie objects.
+    :return: The same list of zombies.
+    """
+    self.__alive_zombies = [z for z in zombies if z.is_alive()]
+    self.__dead_zombies = [z for z in zombies if not z.is_alive()]
+    self.__zombie_grid.rebuild(self.__alive_zombies)
+    for zombie in zombies:
+      zombie.set_on_death(self._on_zombie_death)
     return zombies
 
+  def _on_zombie_death(self, zombie: 'Zombie') -> None:
+    """
+    Moves a zombie that just died from the alive list to the dead list.
+    :param zombie: The zombie that died.
+    """
+    self.__alive_zombies.remove(zombie)
+    self.__dead_zombies.append(zombie)
+    self.__zombie_grid.remove(zombie)
+
+  def get_zombie_grid(self) -> SpatialHash:
+    """
+    Returns the grid indexing the living zombies by position. Callers that
+    move a zombie must update it afterwards.
+    :return: SpatialHash of the living zombies.
+    """
+    return self.__zombie_grid
+
+  def get_zombies_near(self, character: 'Character',
+      distance: int) -> list['Zombie']:
+    """
+    Returns the living zombies that may be within a distance of a character.
+    Zombies further away are never returned, but some of the returned ones
+    can be further than the distance.
+    :param character: Character at the center of the search.
+    :param distance: Distance in pixels around the character to search.
+    :return: List of nearby living zombies.
+    """
+    width, height = Var.DEFAULT_CHARACTER_SIZE
+    return self.__zombie_grid.query(
+        Rect(character.get_x() - distance, character.get_y() - distance,
+             width + 2 * distance, height + 2 * distance))
+
+  def get_alive_zombies(self) -> list['Zombie']:
+    """
+    Returns the zombies that are still alive.
+    :return: List of living zombie objects.
+    """
+    return self.__alive_zombies
+
+  def get_dead_zombies(self) -> list['Zombie']:
+    """
+    Returns the zombies that have been defeated, in order of death.
+    :return: List of dead zombie objects.
+    """
+    return self.__dead_zombies
+
   def start_combat(self, character: 'Character', zombies: list['Zombie'],
       font: FontType) -> bool:
     """
     Starts combat if the hero is near a zombie.
     :param character: The hero character.
-    :param zombies: List of zombies in the level.
+    :param zombies: List of living zombies in the level.
     :param font: font to use for the combat modal.
     :return: True if combat started, False otherwise.
     """
     if self.__combat_instance is None or not self.__combat_instance.get_active():
       for zombie in zombies:
-        if zombie.is_alive() and character.can_attack(zombie):
+        if character.can_attack(zombie):
           self.__combat_instance = Combat(character, zombie,
                                           self.__level_type.value,
                                           self.__questions_set)
           question = self.__combat_instance.generate_question()
           if self.__level_type == LevelType.WORD_ORDERING:
-            words = question.split(" / ")
+            words = self.__combat_instance.get_shuffled_words()
             self.__combat_modal = WordOrderingModal(words, font,
                                                     pygame.Rect(40, 100, 560,
                                                                 260))
@@ -379,7 +570,7 @@ class Level:
     if self.__combat_instance.get_active():
       combat_type = self.__combat_instance.get_combat_type()
       if combat_type == "word_ordering":
-        words = self.__combat_instance.get_current_question().split(" / ")
+        words = self.__combat_instance.get_shuffled_words()
         self.__combat_modal = WordOrderingModal(
             words, font, pygame.Rect(40, 100, 560, 260), result_text=result
         )
@@ -414,13 +605,12 @@ class Level:
     """
     return self.__combat_instance
 
-  def check_open_door(self, zombies: list['Zombie']) -> None:
+  def check_open_door(self) -> None:
     """
     Opens the door if all zombies are defeated.
-    :param zombies: List of zombies in the level.
     """
     if self.__door and self.__door.get_state() == "closed":
-      if all(not z.is_alive() for z in zombies):
+      if not self.__alive_zombies:
         self.__door.open()
 
   def check_medkit_pickup(self) -> None:
@@ -429,8 +619,8 @@ class Level:
     """
     for medkit in self.__medkits:
       if not medkit.get_used() and self.__hero.get_health() < self.__hero.get_max_health():
-        hero_rect = pygame.Rect(self.__hero.get_x(), self.__hero.get_y(), 23,
-                                30)
+        hero_rect = pygame.Rect(self.__hero.get_position(),
+                                Var.DEFAULT_CHARACTER_SIZE)
         medkit_rect = pygame.Rect(medkit.get_x(), medkit.get_y(),
                                   24,
                                   24)
@@ -501,7 +691,7 @@ class FeedbackBox:
       raise Exception(
           "Use FeedbackBox.get_instance() to get the singleton instance.")
     self.__message = ""
-    self.__font = pygame.font.Font(font, 12)
+    self.__font = load_font(font, 12)
     self.__width = width
     self.__height = height
     self.__margin = margin
@@ -509,6 +699,7 @@ class FeedbackBox:
     self.__start_time = None
     self.__delay = 0.0
     self.__delay_start_time = None
+    self.__drawn_rect: Rect | None = None
     FeedbackBox.__instance = self
 
   @staticmethod
@@ -554,6 +745,13 @@ class FeedbackBox:
     """
     return self.__message
 
+  def get_drawn_rect(self) -> Rect | None:
+    """
+    Returns the area covered by the box in the last draw call.
+    :return: Box rectangle, or None if nothing was drawn.
+    """
+    return self.__drawn_rect
+
   def _clear(self) -> None:
     """
     Clears the feedback message immediately.
@@ -588,6 +786,7 @@ class FeedbackBox:
     Draws the feedback box on the given surface if time not expired and delay passed.
     :param surface: Pygame Surface to draw the feedback box on.
     """
+    self.__drawn_rect = None
     if self.__message:
       if self.__delay > 0 and self.__delay_start_time is not None:
         elapsed_delay = time.time() - self.__delay_start_time
@@ -603,7 +802,7 @@ class FeedbackBox:
         box_height = max(self.__height, line_height * len(lines) + 18)
         box = pygame.Surface((self.__width, box_height), pygame.SRCALPHA)
         box.fill(Color.FEEDBACK_BG)
-        surface.blit(box, (self.__margin, self.__margin))
+        self.__drawn_rect = surface.blit(box, (self.__margin, self.__margin))
         for i, line in enumerate(lines):
           txt = self.__font.render(line, True, Var.TEXT_COLOR)
           surface.blit(txt, (self.__margin + 16,
@@ -627,6 +826,8 @@ class PauseMenu:
     self.__confirming = False
     self.__confirm_selected = 1
     self.__active = False
+    self.__overlay: Surface | None = None
+    self.__text_surfaces: dict[str, Surface] = {}
 
     self.__btn_rects = [
       pygame.Rect(rect.x + 40, rect.y + 60, rect.width - 80, 40),
@@ -644,6 +845,13 @@ class PauseMenu:
     """
     return self.__confirming
 
+  def get_render_state(self) -> tuple[int, bool, int]:
+    """
+    Returns the values that decide what the menu looks like.
+    :return: Tuple of selected option, confirming flag and confirm selection.
+    """
+    return self.__selected, self.__confirming, self.__confirm_selected
+
   def get_active(self) -> bool:
     """
     Returns whether the pause menu is active.
@@ -666,19 +874,41 @@ class PauseMenu:
     self.__active = False
     self.__confirming = False
 
+  def __get_overlay(self, size: tuple[int, int]) -> Surface:
+    """
+    Returns the translucent overlay dimming the game behind the menu, creating
+    it again only if the window size changed.
+    :param size: Size of the surface the menu is drawn on.
+    :return: The overlay surface.
+    """
+    if self.__overlay is None or self.__overlay.get_size() != size:
+      self.__overlay = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+      self.__overlay.fill((0, 0, 0, 120))
+    return self.__overlay
+
+  def __get_text(self, text: str) -> Surface:
+    """
+    Returns the rendered menu text, rendering each text only the first time.
+    :param text: The text to render.
+    :return: The text surface.
+    """
+    text_surface = self.__text_surfaces.get(text)
+    if text_surface is None:
+      text_surface = self.__font.render(text, True,
+                                        Color.TITLE_TEXT).convert_alpha()
+      self.__text_surfaces[text] = text_surface
+    return text_surface
+
   def draw(self, surface: Surface) -> None:
     """
     Draws the pause menu on the given surface.
     :param surface: Pygame Surface to draw the pause menu on.
     """
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 120))
-    surface.blit(overlay, (0, 0))
+    surface.blit(self.__get_overlay(surface.get_size()), (0, 0))
     pygame.draw.rect(surface, Color.MODAL_BG, self.__rect, border_radius=12)
     pygame.draw.rect(surface, Color.WORD_BORDER, self.__rect, 2,
                      border_radius=12)
-    title = self.__font.render("Menú de pausa", True, Color.TITLE_TEXT)
-    surface.blit(title, (self.__rect.x + 20, self.__rect.y + 18))
+    surface.blit(self.__get_text("Menú de pausa"), (self.__rect.x + 20, self.__rect.y + 18))
 
     if not self.__confirming:
       for i, txt in enumerate(["Continuar", "Volver al menú principal"]):
@@ -686,18 +916,17 @@ class PauseMenu:
         pygame.draw.rect(surface, bg, self.__btn_rects[i], border_radius=8)
         pygame.draw.rect(surface, Color.WORD_BORDER, self.__btn_rects[i], 2,
                          border_radius=8)
-        txt_surf = self.__font.render(txt, True, Color.TITLE_TEXT)
+        txt_surf = self.__get_text(txt)
         txt_rect = txt_surf.get_rect(center=self.__btn_rects[i].center)
         surface.blit(txt_surf, txt_rect)
     else:
-      question = self.__font.render("¿Estás seguro?", True, Color.TITLE_TEXT)
-      surface.blit(question, (self.__rect.x + 20, self.__rect.y + 70))
+      surface.blit(self.__get_text("¿Estás seguro?"), (self.__rect.x + 20, self.__rect.y + 70))
       for i, txt in enumerate(["Sí", "No"]):
         bg = Color.MENU_SELECTED_BTN if self.__confirm_selected == i else Color.MENU_UNSELECTED_BTN
         pygame.draw.rect(surface, bg, self.__confirm_rects[i], border_radius=8)
         pygame.draw.rect(surface, Color.WORD_BORDER, self.__confirm_rects[i], 2,
                          border_radius=8)
-        txt_surf = self.__font.render(txt, True, Color.TITLE_TEXT)
+        txt_surf = self.__get_text(txt)
         txt_rect = txt_surf.get_rect(center=self.__confirm_rects[i].center)
         surface.blit(txt_surf, txt_rect)
 
@@ -846,10 +1075,10 @@ class TutorialCombatLevel(TutorialLevel):
     :return: List with one zombie object.
     """
     from lib.core import Zombie
-    sprite_w, sprite_h = (23, 30)
+    sprite_w, sprite_h = Var.DEFAULT_CHARACTER_SIZE
     x = Var.DEFAULT_WINDOW_SIZE[0] // 2 - sprite_w // 2
     y = Var.DEFAULT_WINDOW_SIZE[1] // 2 - sprite_h // 2
-    return [Zombie(x, y, health=10)]
+    return self._track_zombies([Zombie(x, y, health=10)])
 
 
 class TutorialHealLevel(TutorialLevel):
@@ -20,6 +20,7 @@ class Door:
     """
     self.__x = x
     self.__y = y
+    self.__entry_rect = pygame.Rect(x, y, 10, 14)
     self.__sprites = sprite_dict
     self.__state = "closed"
     self.__opening_frame = 0
@@ -40,6 +41,20 @@ class Door:
     """
     return self.__y
 
+  def get_rect(self) -> pygame.Rect:
+    """
+    Returns the area covered by the door's current image.
+    :return The door rectangle.
+    """
+    return self.__image.get_rect(topleft=(self.__x, self.__y))
+
+  def get_entry_rect(self) -> pygame.Rect:
+    """
+    Returns the area the hero has to reach to go through the open door.
+    :return The door entry rectangle.
+    """
+    return self.__entry_rect
+
   def get_state(self) -> str:
     """
     Returns the current state of the door.
@@ -118,6 +133,13 @@ class Medkit:
     """
     return self.__y
 
+  def get_rect(self) -> pygame.Rect:
+    """
+    Returns the area covered by the medkit's image.
+    :return The medkit rectangle.
+    """
+    return self.__image.get_rect(topleft=(self.__x, self.__y))
+
   def draw(self, surface: 'Surface') -> None:
     """
     Draws the medkit on the given surface.
@@ -13,10 +13,13 @@ class Var:
   WALK_FRAME_DELAY_BORDER: int = 20
   DAMAGE_DISPLAY_FRAMES: int = 15
   ATTACK_DISPLAY_FRAMES: int = 10
+  ZOMBIE_MOVE_INTERVAL: int = 10
+  ZOMBIE_STEP: int = 15
 
   DEFAULT_WINDOW_SIZE: tuple[int, int] = (640, 480)
   DEFAULT_WALL_THICKNESS: int = 20
   DEFAULT_CELL_SIZE: int = 80
+  DEFAULT_SPAWN_STEP: int = 8
   DEFAULT_DEATH_FADE_DURATION: float = 5.0
 
   TEXT_COLOR: tuple[int, int, int] = (255, 255, 255)
@@ -3,34 +3,52 @@ import random
 from typing import Optional
 
 import pygame
-from pygame import Surface
+from pygame import Surface, QUIT, K_LEFT, K_RIGHT, K_UP, K_DOWN, K_x
+from pygame.key import ScancodeWrapper
 from pygame.time import Clock
 
-from font import FONTS
+from font import FONTS, load_font
 from lib.combat import Combat
 from lib.functions import transition_black_screen, \
-  close_game, find_attackable_zombie, find_closest_zombie, \
-  draw_game, main_menu, check_advance_level, play_music, update_all_sprites
+  close_game, find_target_zombie, \
+  draw_game, main_menu, check_advance_level, play_music, update_all_sprites, \
+  scene_needs_redraw, force_scene_redraw, EXPOSE_EVENTS
 from lib.level import FeedbackBox
 from lib.var import Var
+from sprite import convert_sprites
 
 pygame.init()
 
 window: Surface = pygame.display.set_mode(Var.DEFAULT_WINDOW_SIZE)
 pygame.display.set_caption("English Battle")
+convert_sprites()
+# Nothing in the game reacts to these, so keep them out of the event queue.
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.KEYUP,
+                          pygame.ACTIVEEVENT, pygame.WINDOWMOVED,
+                          pygame.WINDOWENTER, pygame.WINDOWLEAVE,
+                          pygame.FINGERMOTION,
+                          pygame.JOYAXISMOTION, pygame.JOYBALLMOTION,
+                          pygame.JOYHATMOTION, pygame.CONTROLLERAXISMOTION])
 
 repeat: bool = True
 clock: Clock = pygame.time.Clock()
 
-ZOMBIE_MOVE_INTERVAL: int = 10
+ZOMBIE_DIRECTIONS: tuple[tuple[int, int], ...] = (
+  (Var.ZOMBIE_STEP, 0), (-Var.ZOMBIE_STEP, 0), (0, Var.ZOMBIE_STEP),
+  (0, -Var.ZOMBIE_STEP), (0, 0))
 zombie_move_counter: int = 0
 
+# (dx, dy, moving) for every combination of arrow keys, indexed by
+# LEFT | RIGHT << 1 | UP << 2 | DOWN << 3. Opposite keys cancel each other.
+MOVE_TABLE: tuple[tuple[int, int, bool], ...] = tuple(
+  (dx, dy, dx != 0 or dy != 0)
+  for dx, dy in (((mask >> 1 & 1) - (mask & 1),
+                  (mask >> 3 & 1) - (mask >> 2 & 1)) for mask in range(16)))
+
 attack_pressed: bool = False
 
 combat_instance: Optional[Combat] = None
-combat_input_text = ""
-combat_result_text = ""
-font = pygame.font.Font(FONTS.get("roboto"), 16)
+font = load_font(FONTS.get("roboto"), 16)
 
 feedbackBox = FeedbackBox.get_instance()
 first_level: bool = True
@@ -39,65 +57,35 @@ current_level_idx: int
 
 def handle_events() -> None:
   """Handles all pygame events."""
-  global repeat, combat_input_text, combat_result_text
+  global repeat
   for event in pygame.event.get():
-    if event.type == pygame.QUIT:
+    if event.type == QUIT:
       repeat = False
+    elif event.type in EXPOSE_EVENTS:
+      force_scene_redraw()
     pause_result = Var.level.handle_pause_event(event)
     if Var.level.get_pause_menu() and pause_result == "main_menu":
       main_menu(window)
     Var.level.handle_combat_event(event, font)
-    combat = Var.level.get_combat_instance()
-    if combat is not None and combat.get_active():
-      handle_combat_input(event)
-
-
-def handle_combat_input(event) -> None:
-  """Combat input handling."""
-  global combat_instance, combat_input_text, combat_result_text
-  if combat_instance is not None and combat_instance.get_active():
-    if event.type == pygame.KEYDOWN:
-      if event.key == pygame.K_RETURN:
-        if combat_input_text.strip():
-          character.update_sprite_after_damage()
-          for zombie in zombies:
-            zombie.update_sprite_after_damage()
-          draw_game(Var.level, window, character, zombies)
-          combat_result_text = combat_instance.process_turn(combat_input_text)
-          combat_input_text = ""
-      elif event.key == pygame.K_BACKSPACE:
-        combat_input_text = combat_input_text[:-1]
-      else:
-        char = event.unicode
-        if char.isprintable():
-          combat_input_text += char
-
-
-def move_character() -> None:
-  """Moves the hero based on key presses."""
-  global combat_instance
+
+
+def move_character(keys: ScancodeWrapper) -> None:
+  """
+  Moves the hero based on key presses.
+  :param keys: keyboard state snapshot for the current frame.
+  """
   if not Var.level.get_pause_menu().get_active():
-    keys = pygame.key.get_pressed()
-    moving = False
-    dx, dy = 0, 0
-    if keys[pygame.K_LEFT] and not keys[pygame.K_RIGHT]:
-      dx = -1
-      moving = True
-    if keys[pygame.K_RIGHT] and not keys[pygame.K_LEFT]:
-      dx = 1
-      moving = True
-    if keys[pygame.K_UP] and not keys[pygame.K_DOWN]:
-      dy = -1
-      moving = True
-    if keys[pygame.K_DOWN] and not keys[pygame.K_UP]:
-      dy = 1
-      moving = True
+    dx, dy, moving = MOVE_TABLE[
+      keys[K_LEFT] | keys[K_RIGHT] << 1
+      | keys[K_UP] << 2 | keys[K_DOWN] << 3]
 
-    combat_instance = Var.level.get_combat_instance()
     if combat_instance is None or not combat_instance.get_active():
+      # Only zombies within one step of the hero can block it.
+      nearby = Var.level.get_zombies_near(Var.character,
+                                          Var.character.get_speed())
       Var.character.move(dx, dy, moving, Var.DEFAULT_WINDOW_SIZE[0],
                          Var.DEFAULT_WINDOW_SIZE[1],
-                         level=Var.level, other_characters=Var.zombies)
+                         level=Var.level, other_characters=nearby)
     # Si hay combate, nadie se mueve (ni héroe ni zombies)
     else:
       # Bloquea movimiento del héroe y zombies durante combate
@@ -106,27 +94,27 @@ def move_character() -> None:
 
 def handle_combat_trigger() -> None:
   """Detects and initiates combat if the hero is near a zombie."""
-  global combat_result_text, combat_input_text
-  started = Var.level.start_combat(Var.character, Var.zombies, font)
+  global combat_instance
+  nearby = Var.level.get_zombies_near(Var.character,
+                                      Var.character.get_attack_range())
+  started = Var.level.start_combat(Var.character, nearby, font)
   if started:
-    combat_result_text = ""
-    combat_input_text = ""
+    combat_instance = Var.level.get_combat_instance()
 
 
-def handle_attack() -> None:
-  """Handles the attack action when the attack key is pressed."""
-  global attack_pressed, character, zombies, combat_instance
-  keys = pygame.key.get_pressed()
-  if keys[pygame.K_x]:
+def handle_attack(keys: ScancodeWrapper) -> None:
+  """
+  Handles the attack action when the attack key is pressed.
+  :param keys: keyboard state snapshot for the current frame.
+  """
+  global attack_pressed
+  if keys[K_x]:
     if not attack_pressed and (
         combat_instance is None or not combat_instance.get_active()):
-      target = find_attackable_zombie(character, zombies)
+      target = find_target_zombie(Var.character,
+                                  Var.level.get_alive_zombies())
       if target:
-        character.attack(target)
-      else:
-        closest = find_closest_zombie(character, zombies)
-        if closest:
-          character.attack(closest)
+        Var.character.attack(target)
       attack_pressed = True
   else:
     attack_pressed = False
@@ -134,31 +122,30 @@ def handle_attack() -> None:
 
 def move_zombies() -> None:
   """Moves the zombies randomly at set intervals."""
-  global zombie_move_counter, combat_instance
+  global zombie_move_counter
   if not Var.level.get_pause_menu().get_active():
     zombie_move_counter += 1
-    if zombie_move_counter >= ZOMBIE_MOVE_INTERVAL:
-      combat_instance = Var.level.get_combat_instance()
+    if zombie_move_counter >= Var.ZOMBIE_MOVE_INTERVAL:
       if combat_instance is None or not combat_instance.get_active():
-        for zombie in Var.zombies:
-          if not zombie.is_alive():
-            continue
-          zdx, zdy = 0, 0
-          direction = random.choice(
-              [(15, 0), (-15, 0), (0, 15), (0, -15), (0, 0)])
-          zdx, zdy = direction
+        alive_zombies = Var.level.get_alive_zombies()
+        directions = random.choices(ZOMBIE_DIRECTIONS, k=len(alive_zombies))
+        zombie_grid = Var.level.get_zombie_grid()
+        for zombie, (zdx, zdy) in zip(alive_zombies, directions):
           if zdx != 0 or zdy != 0:
-            other_chars = [Var.character] + [z for z in Var.zombies if
-                                             z is not zombie]
+            # A zombie moves at most one step, so anything it could bump into
+            # is within one step of it.
+            other_chars = Var.level.get_zombies_near(zombie, Var.ZOMBIE_STEP)
+            other_chars.append(Var.character)
             zombie.move(zdx, zdy, True, Var.DEFAULT_WINDOW_SIZE[0],
                         Var.DEFAULT_WINDOW_SIZE[1], level=Var.level,
                         other_characters=other_chars)
+            zombie_grid.update(zombie)
       zombie_move_counter = 0
 
 
 def main_loop() -> None:
   """Main game loop."""
-  global repeat, window
+  global repeat, window, combat_instance
   play_music()
   main_menu(window)
   while repeat:
@@ -167,15 +154,18 @@ def main_loop() -> None:
       transition_black_screen(window, 3)
       main_menu(window)
     handle_events()
-    move_character()
+    keys = pygame.key.get_pressed()
+    combat_instance = Var.level.get_combat_instance()
+    move_character(keys)
     handle_combat_trigger()
-    handle_attack()
+    handle_attack(keys)
     move_zombies()
-    update_all_sprites(Var.character, Var.zombies)
-    Var.level.check_open_door(Var.zombies)
+    update_all_sprites(Var.character, Var.level.get_alive_zombies())
+    Var.level.check_open_door()
     Var.level.check_medkit_pickup()
     check_advance_level(Var.level, Var.character, window)
-    draw_game(Var.level, window, Var.character, Var.zombies)
+    if scene_needs_redraw(Var.level, Var.character):
+      draw_game(Var.level, window, Var.character)
     clock.tick(60)
   close_game()
 
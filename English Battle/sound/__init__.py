@@ -12,13 +12,16 @@ SOUNDS: dict[str, SoundType] = {}
 
 MUSIC: dict[str, str] = {}
 
-for filename in os.listdir(os.path.join(SOUND_DIR, 'sfx')):
-  if filename.lower().endswith(('.wav', '.ogg', '.mp3')):
-    sound_name = os.path.splitext(filename)[0]
-    SOUNDS[sound_name] = pygame.mixer.Sound(
-      os.path.join(SOUND_DIR, 'sfx', filename))
-
-for filename in os.listdir(os.path.join(SOUND_DIR, 'music')):
-  if filename.lower().endswith(('.mp3', '.ogg', '.wav')):
-    music_name = os.path.splitext(filename)[0]
-    MUSIC[music_name] = os.path.join(SOUND_DIR, 'music', filename)
+SOUND_EXTENSIONS = ('.wav', '.ogg', '.mp3')
+
+with os.scandir(os.path.join(SOUND_DIR, 'sfx')) as entries:
+  for entry in entries:
+    if entry.is_file() and entry.name.lower().endswith(SOUND_EXTENSIONS):
+      sound_name = os.path.splitext(entry.name)[0]
+      SOUNDS[sound_name] = pygame.mixer.Sound(entry.path)
+
+with os.scandir(os.path.join(SOUND_DIR, 'music')) as entries:
+  for entry in entries:
+    if entry.is_file() and entry.name.lower().endswith(SOUND_EXTENSIONS):
+      music_name = os.path.splitext(entry.name)[0]
+      MUSIC[music_name] = entry.path
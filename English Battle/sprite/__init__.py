@@ -0,0 +1,35 @@
+"""sprite assets for the game"""
+import os
+
+import pygame
+from pygame import Surface
+
+
+def load_sprites(directory: str, files: dict[str, str]) -> dict[str, Surface]:
+  """
+  Loads a set of sprites from a single directory.
+  :param directory: Directory holding the sprite images.
+  :param files: File name of each sprite, by sprite name.
+  :return: The loaded sprites, by sprite name.
+  """
+  return {name: pygame.image.load(os.path.join(directory, file_name))
+          for name, file_name in files.items()}
+
+
+def convert_sprites() -> None:
+  """
+  Converts every loaded sprite to the display pixel format, so blits don't
+  convert them again on each frame. Must be called after the display mode is
+  set.
+  """
+  from sprite.backgrounds import BACKGROUNDS
+  from sprite.characters import HERO_SPRITES
+  from sprite.enemies import ZOMBIE_SPRITES
+  from sprite.levels import DOOR_1_SPRITES, MEDKIT_SPRITES
+
+  for sprites in (HERO_SPRITES, ZOMBIE_SPRITES, DOOR_1_SPRITES,
+                  MEDKIT_SPRITES):
+    for key, sprite in sprites.items():
+      sprites[key] = sprite.convert_alpha()
+  for key, background in BACKGROUNDS.items():
+    BACKGROUNDS[key] = background.convert()
@@ -0,0 +1,50 @@
+"""Tests for the combat modals."""
+from unittest import mock
+
+import pygame
+
+import main
+from lib.color import Color
+from lib.combat import FillGapsModal, WordOrderingModal, \
+  _ANSWER_MAX_LENGTH
+
+
+def _type(modal: FillGapsModal, text: str) -> None:
+  """
+  Sends one KEYDOWN event per character of the text to the modal.
+  :param modal: The modal to type into.
+  :param text: The characters to type.
+  """
+  for char in text:
+    modal.handle_combat_event(pygame.event.Event(
+        pygame.KEYDOWN, key=pygame.K_UNKNOWN, unicode=char))
+
+
+def test_fill_gaps_keeps_only_answer_characters() -> None:
+  """Control characters typed into the answer box are dropped."""
+  modal = FillGapsModal("She ___ happy.", main.font,
+                        pygame.Rect(40, 100, 560, 260))
+  _type(modal, "is\t\x1b ¿sí?")
+  assert modal.get_player_answer() == "is ¿sí?"
+
+
+def test_fill_gaps_caps_the_answer_length() -> None:
+  """Typing stops once the answer reaches its maximum length."""
+  modal = FillGapsModal("She ___ happy.", main.font,
+                        pygame.Rect(40, 100, 560, 260))
+  _type(modal, "a" * (_ANSWER_MAX_LENGTH + 5))
+  assert modal.get_player_answer() == "a" * _ANSWER_MAX_LENGTH
+
+
+def test_dragged_word_follows_the_pointer_without_render_state() -> None:
+  """draw() places the dragged word at the current pointer by itself."""
+  modal = WordOrderingModal(["She", "is", "happy"], main.font,
+                            pygame.Rect(40, 100, 560, 260))
+  word_rect = modal._WordOrderingModal__word_rects["shuffled"][0]
+  modal.handle_combat_event(pygame.event.Event(
+      pygame.MOUSEBUTTONDOWN, pos=word_rect.center, button=1))
+  surface = pygame.Surface(main.window.get_size())
+  with mock.patch("pygame.mouse.get_pos", return_value=(300, 60)):
+    modal.draw(surface)
+  # Just inside the top left corner of the dragged word's box.
+  assert tuple(surface.get_at((258, 47)))[:3] == Color.DRAG_WORD_BG
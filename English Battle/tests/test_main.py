@@ -0,0 +1,80 @@
+"""Tests for the main game loop's event handling."""
+from unittest import mock
+
+import pygame
+
+import main
+from lib.combat import Combat
+from lib.core import Zombie
+from lib.functions import draw_game, init_score_system, setup_level, \
+  scene_needs_redraw
+from lib.level import FeedbackBox
+from lib.var import Var
+
+
+def _start_combat(level_type: str) -> Combat:
+  """
+  Sets up the first level of the given type with a sturdy zombie next to the
+  hero and starts a combat against it.
+  :param level_type: Combat type of the level to set up.
+  :return: The active combat.
+  """
+  init_score_system()
+  level_idx = next(idx for idx, config in enumerate(Var.LEVELS_CONFIG)
+                   if not config.get("tutorial")
+                   and config["type"] == level_type)
+  Var.character, Var.level, Var.zombies = setup_level(level_idx)
+  zombie = Zombie(*Var.character.get_position(), health=100)
+  assert Var.level.start_combat(Var.character, [zombie], main.font)
+  pygame.event.clear()
+  # main_loop refreshes this every frame.
+  main.combat_instance = Var.level.get_combat_instance()
+  return main.combat_instance
+
+
+def _post_keys(*keys: tuple[int, str]) -> None:
+  """
+  Queues a KEYDOWN event for every (key, unicode) pair.
+  :param keys: The keys to press, in order.
+  """
+  for key, char in keys:
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key,
+                                         unicode=char))
+
+
+def test_return_processes_one_turn() -> None:
+  """One Return on a typed answer scores it exactly once."""
+  _start_combat("fill_in_the_blank")
+  _post_keys((pygame.K_i, "i"), (pygame.K_s, "s"), (pygame.K_RETURN, "\r"))
+  with mock.patch.object(Combat, "process_turn", autospec=True,
+                         side_effect=Combat.process_turn) as process_turn:
+    main.handle_events()
+  assert process_turn.call_count == 1
+
+
+def test_typed_keys_are_not_scored_in_choice_combat() -> None:
+  """Keys typed during a multiple choice combat are never scored."""
+  _start_combat("multiple_choice")
+  _post_keys((pygame.K_x, "x"), (pygame.K_RETURN, "\r"))
+  with mock.patch.object(Combat, "process_turn", autospec=True,
+                         side_effect=Combat.process_turn) as process_turn:
+    main.handle_events()
+  assert process_turn.call_count == 0
+
+
+def test_expose_forces_a_full_redraw() -> None:
+  """An exposed window is drawn and pushed in full even if nothing moved."""
+  init_score_system()
+  Var.character, Var.level, Var.zombies = setup_level(0)
+  # A timed message would keep every frame redrawing.
+  FeedbackBox.get_instance()._clear()
+  pygame.event.clear()
+  scene_needs_redraw(Var.level, Var.character)
+  draw_game(Var.level, main.window, Var.character)
+  assert not scene_needs_redraw(Var.level, Var.character)
+  pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+  main.handle_events()
+  assert scene_needs_redraw(Var.level, Var.character)
+  with mock.patch("pygame.display.flip") as flip:
+    draw_game(Var.level, main.window, Var.character)
+  assert flip.call_count == 1